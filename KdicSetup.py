@@ -1,9 +1,10 @@
 # KdicSetup.py
 
 # sys 모듈: 파이썬 인터프리터가 제공하는 변수와 함수를 직접 제어할 수 있게 해줍니다.
-# traceback 모듈: 프로그램 실행 중 발생한 오류의 트레이스백 정보를 추출하고 형식화하는 기능을 제공합니다.
+# threading 모듈: 시작 시 부가 작업을 백그라운드 스레드에서 실행하기 위해 사용합니다.
+# (traceback 모듈은 오류가 발생했을 때만 필요하므로 global_exception_hook 안에서 가져옵니다.)
 import sys
-import traceback
+import threading
 
 # PyQt6.QtWidgets 모듈: GUI 애플리케이션을 만드는 데 필요한 위젯들을 포함합니다.
 # QApplication: GUI 애플리케이션의 실행을 관리하는 클래스입니다.
@@ -14,6 +15,10 @@ from PyQt6.QtWidgets import QApplication, QMessageBox
 # QIcon: 애플리케이션 창이나 버튼 등에 사용될 아이콘을 관리하는 클래스입니다.
 from PyQt6.QtGui import QIcon
 
+# PyQt6.QtCore 모듈: Qt의 핵심 비-GUI 기능을 제공합니다.
+# QTimer: 이벤트 루프가 시작된 후 특정 작업을 실행하도록 예약하는 데 사용합니다.
+from PyQt6.QtCore import QTimer
+
 # logger.py 파일에서 로깅 시스템 설정을 위한 setup_logging 함수를 가져옵니다.
 from logger import setup_logging
 
@@ -73,6 +78,15 @@ def global_exception_hook(exctype, value, tb):
     처리되지 않은 모든 예외를 잡아 사용자에게 팝업으로 보여주는 함수.
     이 함수는 프로그램 전체에서 발생하는 예외를 일관되게 처리하기 위해 사용됩니다.
     """
+    # GUI가 아직 시작되지 않았고 콘솔(터미널)에서 실행 중이라면,
+    # 트레이스백 문자열을 만들지 않고 기본 예외 처리기로 바로 출력한 뒤 종료합니다.
+    if QApplication.instance() is None and sys.stderr is not None and sys.stderr.isatty():
+        sys.__excepthook__(exctype, value, tb)
+        sys.exit(1)
+
+    # traceback 모듈: 오류의 트레이스백 정보를 추출하고 형식화하는 기능을 제공합니다.
+    import traceback
+
     # 예외 타입, 값, 트레이스백 정보를 문자열로 변환합니다.
     traceback_details = "".join(traceback.format_exception(exctype, value, tb))
     # 사용자에게 보여줄 오류 메시지를 생성합니다.
@@ -91,7 +105,9 @@ def global_exception_hook(exctype, value, tb):
 def main():
     """애플리케이션의 진입점(entry point) 함수."""
     # --- 추가된 부분: 프로그램 시작 시 빠른 편집 모드 비활성화 함수 호출 ---
-    disable_quick_edit_mode()
+    # 콘솔 API 호출은 QApplication/View 생성과 순서 의존성이 없으므로,
+    # 백그라운드 스레드에서 실행하여 UI 초기화와 겹쳐서 처리되도록 합니다.
+    threading.Thread(target=disable_quick_edit_mode, daemon=True).start()
 
     # 파이썬의 기본 예외 처리기를 우리가 만든 global_exception_hook 함수로 교체합니다.
     sys.excepthook = global_exception_hook
@@ -110,8 +126,9 @@ def main():
     controller = Controller(view)
     # UI 창을 화면에 표시합니다.
     view.show()
-    # 컨트롤러를 통해 시스템 분석(로딩) 작업을 시작합니다.
-    controller.start_loading()
+    # 이벤트 루프가 시작된 직후에 시스템 분석(로딩) 작업을 시작하도록 예약합니다.
+    # (창이 먼저 그려진 뒤 분석이 시작되므로 첫 화면이 더 빨리 표시됩니다.)
+    QTimer.singleShot(0, controller.start_loading)
 
     # 애플리케이션의 이벤트 루프를 시작합니다. 사용자의 입력을 받고 처리하며, 창이 닫힐 때까지 실행됩니다.
     # app.exec()의 반환값으로 프로그램을 종료합니다.
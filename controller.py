@@ -1,7 +1,10 @@
 # controller.py
 
-# re 모듈: 정규 표현식을 사용하여 문자열을 처리하는 기능을 제공합니다.
-import re
+# codecs 모듈: UTF-8 BOM(바이트 순서 표시) 상수(BOM_UTF8)를 제공합니다.
+import codecs
+
+# functools 모듈: 함수 결과를 캐시하는 lru_cache 데코레이터를 제공합니다.
+import functools
 
 # os 모듈: 운영체제와 상호작용하는 기능을 제공합니다. (예: 파일 경로 다루기, 파일 존재 여부 확인)
 import os
@@ -15,9 +18,11 @@ import sys
 # logging 모듈: 애플리케이션의 이벤트와 오류를 기록하는 로깅 기능을 제공합니다.
 import logging
 
-# PyQt6.QtCore 모듈에서 QTimer 클래스를 가져옵니다.
+# PyQt6.QtCore 모듈에서 Qt, QTimer, QRunnable, QThreadPool 클래스를 가져옵니다.
+# Qt: 시그널 연결 방식(ConnectionType) 등 Qt 전역 상수를 제공합니다.
 # QTimer: 일정 시간 간격으로 특정 작업을 수행하게 해주는 타이머 클래스입니다.
-from PyQt6.QtCore import QTimer
+# QRunnable, QThreadPool: 시스템 분석(Loader), 파일 쓰기 등 백그라운드 작업을 스레드 풀에서 실행하는 데 사용합니다.
+from PyQt6.QtCore import Qt, QTimer, QRunnable, QThreadPool
 
 # 각 모듈에서 필요한 클래스들을 가져옵니다.
 from view import View  # UI를 담당하는 View 클래스
@@ -25,14 +30,135 @@ from models import (
     Options,
     SystemInfo,
 )  # 데이터 구조를 정의하는 Options, SystemInfo 데이터 클래스
-from loader import Loader  # 시스템 분석을 수행하는 Loader 스레드 클래스
 from logger import USER_LOG_LEVEL, log_function_call  # 로깅 관련 상수 및 데코레이터
-from dialog import (
-    ConfirmationDialog,
-    RebootDialog,
-)  # 사용자 확인 및 재부팅 대화상자 클래스
-from utils import reboot_system  # 시스템 재부팅 유틸리티 함수
-from worker import Worker  # 실제 자동화 작업을 수행하는 Worker 스레드 클래스
+
+# loader(시스템 분석), dialog(대화상자), utils(재부팅), worker(자동화 작업) 모듈은
+# 첫 화면 표시 이후에만 필요하므로 프로그램 시작 속도를 위해 실제로 사용하는 메서드 안에서 가져옵니다.
+
+
+# info.txt의 섹션 이름과 UI의 버튼 ID를 매핑하는 딕셔너리
+_KEY_MAP = {"내부망": 0, "인터넷": 1, "출장용": 2, "K자회사": 3}
+# info.txt를 바이트로 읽어 섹션 이름을 비교하기 위해, 섹션 이름을 미리 utf-8로 인코딩해 둔 딕셔너리
+_SECTION_IDS = {name.encode("utf-8"): type_id for name, type_id in _KEY_MAP.items()}
+# 설명이 없는 타입에 표시할 기본 문구
+_DEFAULT_DESCRIPTION = "타입을 선택하면 여기에 설명이 표시됩니다."
+# 기존 기록과의 차이가 이 값(초)보다 작으면 completion_time.txt를 다시 쓰지 않습니다.
+_COMPLETION_TIME_WRITE_THRESHOLD = 5
+
+
+def _get_base_path() -> str:
+    """실행 파일(또는 스크립트)이 위치한 기본 경로를 반환합니다."""
+    # PyInstaller 등으로 패키징되었는지(frozen) 여부를 확인하여 실행 파일의 기본 경로를 결정합니다.
+    if getattr(sys, "frozen", False):
+        # 패키징된 경우: 실행 파일이 있는 디렉토리
+        return os.path.dirname(sys.executable)
+    # 일반 파이썬 스크립트로 실행된 경우: 이 파일(controller.py)이 있는 디렉토리
+    return os.path.dirname(os.path.abspath(__file__))
+
+
+def _parse_descriptions(data: bytes) -> dict:
+    """
+    info.txt 내용(바이트)을 파싱하여 {버튼 ID: 설명} 딕셔너리로 반환합니다.
+    _KEY_MAP에 있는 섹션의 내용만 utf-8로 디코딩하고, 나머지 섹션은 디코딩하지 않고 건너뜁니다.
+    """
+    descriptions = {}
+    # "[섹션명]" 줄을 기준으로 다음 섹션 전까지의 줄들을 내용으로 모읍니다. (한 번의 순회로 처리)
+    # current_id: 현재 섹션의 버튼 ID (_KEY_MAP에 없는 섹션이면 None)
+    current_id = None
+    section_lines = []
+    # 메모장 등으로 저장하여 파일 앞에 BOM이 있으면, 첫 섹션 헤더가 "["로 시작하도록 먼저 제거합니다.
+    data = data.removeprefix(codecs.BOM_UTF8)
+    for line in data.splitlines():
+        if line.startswith(b"[") and line.endswith(b"]"):
+            # 새 섹션이 시작되면 이전 섹션의 내용을 저장합니다.
+            if current_id is not None:
+                descriptions[current_id] = b"\n".join(section_lines).decode("utf-8").strip()
+            current_id = _SECTION_IDS.get(line[1:-1])
+            section_lines = []
+        elif current_id is not None:
+            section_lines.append(line)
+    # 마지막 섹션의 내용을 저장합니다.
+    if current_id is not None:
+        descriptions[current_id] = b"\n".join(section_lines).decode("utf-8").strip()
+    return descriptions
+
+
+@functools.lru_cache(maxsize=1)
+def _load_descriptions_cached(base_path: str) -> dict:
+    """
+    info.txt 파일에서 각 PC 타입에 대한 설명을 읽어와 딕셔너리로 반환합니다.
+    info.txt는 실행 중에 바뀌지 않으므로 결과를 캐시하여 모든 Controller가 공유합니다.
+    """
+    descriptions = {}
+    try:
+        # info.txt 파일의 전체 경로를 생성합니다.
+        info_file_path = os.path.join(base_path, "info.txt")
+
+        # 존재 여부를 따로 확인하지 않고, 파일이 없으면 빈 딕셔너리를 반환합니다.
+        try:
+            # 파일을 바이트로 한 번에 읽습니다. (디코딩은 필요한 섹션만 수행)
+            with open(info_file_path, "rb") as f:
+                data = f.read()
+        except FileNotFoundError:
+            return {}
+
+        descriptions = _parse_descriptions(data)
+    except Exception as e:
+        # 파일 읽기 또는 파싱 중 오류 발생 시 에러 로그를 기록합니다.
+        logging.error(f"info.txt 파일을 읽거나 파싱하는 데 실패했습니다: {e}")
+    return descriptions
+
+
+def _default_seconds_for_disk(disk_type: str) -> int:
+    """OS 디스크 타입에 따른 기본 예상 작업 시간(초)을 반환합니다."""
+    disk_type = disk_type.upper()
+    if "NVME" in disk_type:
+        return 6 * 60  # NVMe: 6분
+    if "SSD" in disk_type:
+        return 7 * 60  # SSD: 7분
+    return 8 * 60  # HDD: 8분
+
+
+def _format_min_sec(total_seconds: int) -> str:
+    """초 단위 시간을 "M분 S초" 형식의 문자열로 변환합니다."""
+    minutes, seconds = divmod(total_seconds, 60)
+    return f"{minutes}분 {seconds}초"
+
+
+class _CompletionTimeWriter(QRunnable):
+    """작업 소요 시간을 completion_time.txt에 기록하는 작업을 스레드 풀에서 실행하기 위한 클래스입니다."""
+
+    def __init__(self, time_file_path: str, elapsed_seconds: int):
+        super().__init__()
+        self._time_file_path = time_file_path  # 기록할 파일의 전체 경로
+        self._elapsed_seconds = elapsed_seconds  # 기록할 소요 시간 (초)
+
+    def run(self):
+        """스레드 풀의 스레드에서 호출되어 실제로 파일을 기록합니다."""
+        # 임시 파일에 먼저 기록한 뒤 os.replace로 교체하여, 쓰기 도중 중단되어도 기존 파일이 깨지지 않도록 합니다.
+        tmp_file_path = self._time_file_path + ".tmp"
+        data = f"{self._elapsed_seconds}\n".encode("ascii")
+        replaced = False  # os.replace까지 완료되었는지 여부
+        try:
+            # 바이너리 모드로 열어 실제 소요 시간(초)을 한 번의 write로 기록합니다.
+            with open(tmp_file_path, "wb", buffering=0) as f:
+                f.write(data)
+                os.fsync(f.fileno())  # 디스크에 실제로 기록되었음을 보장
+            os.replace(tmp_file_path, self._time_file_path)
+            replaced = True
+            logging.info(
+                f"작업 소요 시간({self._elapsed_seconds}초)을 '{self._time_file_path}'에 저장했습니다."
+            )
+        except OSError as e:
+            # 파일 쓰기 중 오류 발생 시 에러 로그를 기록합니다.
+            logging.error(f"작업 시간을 파일에 쓰는 중 오류가 발생했습니다: {e}")
+        finally:
+            # 교체하지 못했다면 임시 파일이 남지 않도록 삭제합니다. (임시 파일이 없으면 무시)
+            if not replaced:
+                try:
+                    os.remove(tmp_file_path)
+                except OSError:
+                    pass
 
 
 class Controller:
@@ -45,116 +171,123 @@ class Controller:
     def __init__(self, view: View):
         """Controller 클래스의 생성자입니다."""
         self._view = view  # View 객체를 멤버 변수로 저장
-        self._loader = Loader()  # 시스템 분석을 위한 Loader 객체 생성
+        # 사용자 로그 출력에 사용할 로거를 미리 바인딩합니다. (매 호출 시 전역 조회 방지)
+        self._logger = logging.getLogger(__name__)
+        self._loader = None  # 시스템 분석을 위한 Loader 객체 (start_loading에서 생성)
         self._system_info: SystemInfo = (
             None  # 시스템 분석 정보를 저장할 변수, 초기값은 None
         )
         self._worker = None  # 자동화 작업을 위한 Worker 객체를 저장할 변수
-        self._descriptions = (
-            self._load_descriptions()
-        )  # info.txt 파일에서 PC 타입별 설명을 로드
+        self._confirm_dialog = None  # 재사용할 데이터 삭제 확인 대화상자 (처음 사용할 때 생성)
+        self._reboot_dialog = None  # 재사용할 재부팅 대화상자 (처음 사용할 때 생성)
+        self._is_save_possible = False  # 분석 결과 '데이터 보존'이 가능한 환경인지 여부
+        # PC 타입별 설명은 처음 타입이 선택될 때 로드합니다. (첫 화면 표시를 늦추지 않기 위함)
+        self._descriptions = None
+        self._last_selected_type_id = None  # 하단 설명란에 마지막으로 표시한 타입 ID
         self._connect_signals()  # UI 이벤트(시그널)와 컨트롤러 메서드(슬롯)를 연결
 
         # 예상 남은 시간 표시를 위한 타이머 설정
         self._timer = QTimer()  # QTimer 객체 생성
+        # 주기 타이머 대신 단발성(single-shot) 타이머로 설정하고, 매번 다음 초 경계에 맞춰 다시 예약합니다.
+        self._timer.setSingleShot(True)
+        # 초 단위 라벨에는 정밀 타이머가 필요 없으므로 CoarseTimer를 명시하여 불필요한 정밀 깨우기를 피합니다.
+        self._timer.setTimerType(Qt.TimerType.CoarseTimer)
         self._timer.timeout.connect(
             self._update_time_label
         )  # 타이머의 timeout 시그널이 발생할 때마다 _update_time_label 메서드 호출
+        self._last_time_str = ""  # 마지막으로 표시한 남은 시간 문자열 (중복 갱신 방지용)
+
+        # Worker의 진행률 업데이트를 50ms(20Hz) 단위로 모아서 반영하기 위한 타이머 설정
+        self._pending_progress = None  # 아직 UI에 반영되지 않은 최신 진행률 값
+        self._applied_progress = None  # 마지막으로 프로그레스 바에 반영한 진행률 값
+        self._set_progress = None  # 작업 중 미리 바인딩해 두는 progress_bar.setValue 메서드
+        self._progress_timer = QTimer()
+        self._progress_timer.setSingleShot(True)
+        self._progress_timer.setInterval(50)
+        self._progress_timer.timeout.connect(self._flush_progress)
         self._total_seconds = 0  # 예상되는 총 작업 시간 (초)
-        self._start_time = None  # 실제 작업 시작 시간
-
-    def _load_descriptions(self) -> dict:
-        """info.txt 파일에서 각 PC 타입에 대한 설명을 읽어와 딕셔너리로 반환합니다."""
-        descriptions = {}
-        # info.txt의 섹션 이름과 UI의 버튼 ID를 매핑하는 딕셔너리
-        key_map = {"내부망": 0, "인터넷": 1, "출장용": 2, "K자회사": 3}
-
-        try:
-            # PyInstaller 등으로 패키징되었는지(frozen) 여부를 확인하여 실행 파일의 기본 경로를 결정합니다.
-            if getattr(sys, "frozen", False):
-                # 패키징된 경우: 실행 파일이 있는 디렉토리
-                base_path = os.path.dirname(sys.executable)
-            else:
-                # 일반 파이썬 스크립트로 실행된 경우: 이 파일(controller.py)이 있는 디렉토리
-                base_path = os.path.dirname(os.path.abspath(__file__))
-
-            # info.txt 파일의 전체 경로를 생성합니다.
-            info_file_path = os.path.join(base_path, "info.txt")
-
-            # info.txt 파일이 존재하지 않으면 빈 딕셔너리를 반환합니다.
-            if not os.path.exists(info_file_path):
-                return {}
-            # 파일을 utf-8 인코딩으로 읽습니다.
-            with open(info_file_path, "r", encoding="utf-8") as f:
-                content = f.read()
-            # 정규 표현식을 사용하여 "[섹션명]\n내용" 형식의 부분을 모두 찾습니다.
-            sections = re.findall(r"\[(.*?)\]\n(.*?)(?=\n\[|$)", content, re.DOTALL)
-            for section_name, section_content in sections:
-                if section_name in key_map:
-                    # key_map을 이용해 섹션 이름을 버튼 ID로 변환하여 딕셔너리에 저장합니다.
-                    descriptions[key_map[section_name]] = section_content.strip()
-        except Exception as e:
-            # 파일 읽기 또는 파싱 중 오류 발생 시 에러 로그를 기록합니다.
-            logging.error(f"info.txt 파일을 읽거나 파싱하는 데 실패했습니다: {e}")
-        return descriptions
+        self._default_seconds = 8 * 60  # 저장된 작업 시간이 없을 때 사용할 기본 예상 시간 (초)
+        self._start_time_ns = None  # 실제 작업 시작 시각 (monotonic 나노초)
 
     def _connect_signals(self):
         """UI 요소의 시그널(이벤트)을 해당 컨트롤러 메서드(슬롯)에 연결합니다."""
         self._view.start_clicked.connect(self.start_automation)
         self._view.stop_clicked.connect(self.stop_automation)
         self._view.start_stop_button.clicked.connect(self.on_start_stop_button_toggled)
-        self._loader.finished.connect(self.on_loading_finished)
-        self._loader.error_occurred.connect(self.on_loading_error)
         self._view.types_button_group.idClicked.connect(self._on_type_selected)
 
     def _on_type_selected(self, type_id: int):
         """PC 타입 라디오 버튼이 선택되었을 때, 하단 설명란에 해당 타입의 설명을 표시합니다."""
-        default_text = "타입을 선택하면 여기에 설명이 표시됩니다."
-        # _descriptions 딕셔너리에서 선택된 ID에 해당하는 설명을 가져옵니다. 없으면 default_text를 사용합니다.
-        description = self._descriptions.get(type_id, default_text)
+        # 이미 같은 타입의 설명이 표시되어 있으면 다시 설정하지 않습니다. (불필요한 레이아웃 갱신 방지)
+        if type_id == self._last_selected_type_id:
+            return
+        self._last_selected_type_id = type_id
+        if self._descriptions is None:
+            self._descriptions = self._load_descriptions()
+        # _descriptions 튜플에서 선택된 ID에 해당하는 설명을 가져옵니다. 범위를 벗어나면 기본 문구를 사용합니다.
+        if 0 <= type_id < len(self._descriptions):
+            description = self._descriptions[type_id]
+        else:
+            description = _DEFAULT_DESCRIPTION
         self._view.log_viewer_bottom.setText(description)
 
+    def _load_descriptions(self) -> tuple:
+        """info.txt의 설명을 버튼 ID(0~3)로 바로 조회할 수 있는 튜플로 반환합니다."""
+        descriptions = _load_descriptions_cached(
+            _get_base_path()
+        )  # info.txt 파일에서 PC 타입별 설명을 로드 (모듈 단위로 한 번만 파싱)
+        return tuple(
+            descriptions.get(i, _DEFAULT_DESCRIPTION) for i in range(len(_KEY_MAP))
+        )
+
     @log_function_call
     def on_loading_finished(self, system_info: SystemInfo):
         """Loader의 시스템 분석이 완료되었을 때 호출되는 메서드."""
         self._system_info = system_info  # 분석된 시스템 정보를 멤버 변수에 저장
-        self._view.set_ui_for_loading(False)  # UI를 로딩 완료 상태로 변경
+        # OS 디스크 타입에 따른 기본 예상 작업 시간을 미리 계산해 둡니다.
+        self._default_seconds = _default_seconds_for_disk(system_info.system_disk_type)
 
         logging.info(f"분석된 시스템 정보: {system_info}")
 
-        # 데이터 보존이 가능한 환경인지 판단합니다.
-        # 조건: 시스템 볼륨이 1개이고, 데이터 볼륨과 부트 볼륨이 모두 존재해야 함.
-        is_save_possible = (
-            system_info.system_volume_count == 1
-            and system_info.data_volume_index != -1
-            and system_info.boot_volume_index != -1
-        )
+        # 데이터 보존이 가능한 환경인지 한 번만 판단하여 저장해 둡니다. (판단 조건은 SystemInfo에 정의되어 있음)
+        self._is_save_possible = system_info.is_save_possible
 
-        if is_save_possible:
-            self._view.set_data_save_enabled(True)  # '데이터 보존' 버튼 활성화
-            logging.log(USER_LOG_LEVEL, "분석 완료: 데이터 저장이 가능한 환경입니다.")
+        self._view.set_ui_for_loading(False)  # UI를 로딩 완료 상태로 변경
+        # '데이터 보존' 버튼 활성화/비활성화
+        self._view.set_data_save_enabled(self._is_save_possible)
+
+        if self._is_save_possible:
+            self._logger.log(USER_LOG_LEVEL, "분석 완료: 데이터 저장이 가능한 환경입니다.")
+        elif system_info.system_volume_count > 1:
+            self._logger.log(
+                USER_LOG_LEVEL,
+                "분석 완료: 시스템 볼륨이 2개 이상 발견되어 데이터 저장이 불가능합니다.",
+            )
         else:
-            self._view.set_data_save_enabled(False)  # '데이터 보존' 버튼 비활성화
-            if system_info.system_volume_count > 1:
-                logging.log(
-                    USER_LOG_LEVEL,
-                    "분석 완료: 시스템 볼륨이 2개 이상 발견되어 데이터 저장이 불가능합니다.",
-                )
-            else:
-                logging.log(
-                    USER_LOG_LEVEL, "분석 완료: 데이터 저장이 불가능한 환경입니다."
-                )
+            self._logger.log(
+                USER_LOG_LEVEL, "분석 완료: 데이터 저장이 불가능한 환경입니다."
+            )
 
     @log_function_call
     def start_loading(self):
         """프로그램 시작 시 시스템 분석(Loader) 스레드를 시작합니다."""
         self._view.set_ui_for_loading(True)  # UI를 로딩 중 상태로 변경
-        self._loader.start()  # Loader 스레드 시작
+        if self._loader is None:
+            from loader import Loader  # 시스템 분석을 수행하는 Loader 작업 클래스
+
+            # Loader 객체는 처음 분석을 시작할 때 생성하고 시그널을 연결합니다.
+            # Loader는 스레드 풀의 스레드에서 실행되므로 QueuedConnection을 명시합니다.
+            queued = Qt.ConnectionType.QueuedConnection
+            self._loader = Loader()
+            self._loader.finished.connect(self.on_loading_finished, type=queued)
+            self._loader.error_occurred.connect(self.on_loading_error, type=queued)
+        # 전역 스레드 풀에서 Loader를 실행합니다. (다시 분석할 때도 스레드를 새로 만들지 않고 재사용)
+        QThreadPool.globalInstance().start(self._loader)
 
     @log_function_call
     def on_loading_error(self, error_message: str):
         """Loader 스레드에서 오류 발생 시 호출됩니다."""
-        logging.log(USER_LOG_LEVEL, f"오류: {error_message}")
+        self._logger.log(USER_LOG_LEVEL, "오류: %s", error_message)
         self._view.set_progress_bar_infinite(False)  # 프로그레스 바 무한 모드 해제
 
     @log_function_call
@@ -164,7 +297,7 @@ class Controller:
             # 선택된 PC 타입의 ID를 가져옵니다.
             type_id = self._view.types_button_group.checkedId()
             if type_id == -1:  # 아무것도 선택되지 않았을 경우
-                logging.log(USER_LOG_LEVEL, "오류: PC 타입을 먼저 선택해주세요.")
+                self._logger.log(USER_LOG_LEVEL, "오류: PC 타입을 먼저 선택해주세요.")
                 self._view.start_stop_button.setChecked(
                     False
                 )  # 버튼 상태를 다시 '시작'으로 되돌림
@@ -173,10 +306,15 @@ class Controller:
             save_checked = self._view.data_save_button.isChecked()
             # '데이터 보존'이 선택되지 않았을 경우 (데이터 삭제)
             if not save_checked:
-                dialog = ConfirmationDialog(
-                    self._view
-                )  # 데이터 삭제 확인 대화상자 표시
-                if not dialog.exec():  # 사용자가 '취소'를 누른 경우
+                # 데이터 삭제 확인 대화상자는 처음 필요할 때 한 번만 만들고, 이후에는 초기화하여 재사용합니다.
+                if self._confirm_dialog is None:
+                    from dialog import ConfirmationDialog
+
+                    self._confirm_dialog = ConfirmationDialog(self._view)
+                else:
+                    self._confirm_dialog.reset()
+                # 데이터 삭제 확인 대화상자 표시
+                if not self._confirm_dialog.exec():  # 사용자가 '취소'를 누른 경우
                     self._view.start_stop_button.setChecked(False)  # 버튼 상태를 되돌림
                     return
 
@@ -194,7 +332,8 @@ class Controller:
     @log_function_call
     def start_automation(self, options: Options):
         """자동화 작업(Worker) 스레드를 시작하고 타이머를 설정합니다."""
-        self._view.log_viewer_top.clear()  # 상단 로그 뷰어 초기화
+        # 상단 로그 뷰어 초기화 (출력 대기 중인 로그도 함께 비움)
+        self._view.clear_log()
         self._on_type_selected(
             self._view.types_button_group.checkedId()
         )  # 하단 설명창 업데이트
@@ -208,27 +347,33 @@ class Controller:
                 f"저장된 작업 시간({self._total_seconds}초)을 불러와 예상 시간으로 설정합니다."
             )
         # 2. 저장된 시간이 없으면 OS가 설치된 디스크 타입에 따라 기본 시간을 설정합니다.
+        #    (디스크 타입별 기본 시간은 분석 완료 시점에 미리 계산해 둡니다.)
         else:
-            disk_type = self._system_info.system_disk_type.upper()
-            if "NVME" in disk_type:
-                self._total_seconds = 6 * 60  # NVMe: 6분
-            elif "SSD" in disk_type:
-                self._total_seconds = 7 * 60  # SSD: 7분
-            else:
-                self._total_seconds = 8 * 60  # HDD: 8분
+            self._total_seconds = self._default_seconds
             logging.info(
-                f"{disk_type} 디스크 타입에 따라 예상 시간을 {self._total_seconds}초로 설정합니다."
+                f"{self._system_info.system_disk_type} 디스크 타입에 따라 예상 시간을 {self._total_seconds}초로 설정합니다."
             )
 
-        self._start_time = time.time()  # 실제 작업 시작 시간을 기록
-        self._timer.start(1000)  # 1초 간격의 타이머 시작
+        # 시스템 시계 변경에 영향을 받지 않는 monotonic 시계(정수 나노초)로 시작 시각을 기록합니다.
+        self._start_time_ns = time.monotonic_ns()
+        self._last_time_str = ""
+        self._update_time_label()  # 남은 시간을 즉시 표시하고 다음 갱신을 예약
 
         # Worker 스레드를 생성하고 시그널을 슬롯에 연결한 후 시작합니다.
+        from worker import Worker  # 실제 자동화 작업을 수행하는 Worker 스레드 클래스
+
         self._worker = Worker(options, self._system_info)
-        self._worker.progress_updated.connect(self.on_worker_progress_updated)
-        self._worker.log_updated.connect(self.on_worker_log_updated)
-        self._worker.finished.connect(self.on_worker_finished)
-        self._worker.error_occurred.connect(self.on_worker_error)
+        # 진행률 갱신 시 매번 속성을 조회하지 않도록 setValue 메서드를 미리 바인딩합니다.
+        self._set_progress = self._view.progress_bar.setValue
+        self._applied_progress = None
+        # Worker는 별도 스레드에서 시그널을 보내므로, UI 스레드에서 슬롯이 실행되도록 QueuedConnection을 명시합니다.
+        queued = Qt.ConnectionType.QueuedConnection
+        self._worker.progress_updated.connect(
+            self.on_worker_progress_updated, type=queued
+        )
+        self._worker.log_updated.connect(self.on_worker_log_updated, type=queued)
+        self._worker.finished.connect(self.on_worker_finished, type=queued)
+        self._worker.error_occurred.connect(self.on_worker_error, type=queued)
         self._worker.start()
 
     @log_function_call
@@ -238,40 +383,64 @@ class Controller:
             self._worker.stop()  # Worker 스레드의 중지 플래그를 설정
 
     def on_worker_progress_updated(self, value: int):
-        """Worker로부터 진행률 업데이트를 받아 UI에 반영합니다."""
-        self._view.progress_bar.setValue(value)
+        """
+        Worker로부터 진행률 업데이트를 받아 UI에 반영합니다.
+        짧은 시간에 여러 번 들어오는 값은 최신 값만 남겨 50ms마다 한 번씩 반영합니다.
+        """
+        self._pending_progress = value
+        if value >= 100:
+            # 완료(100%)는 지연 없이 즉시 반영합니다.
+            self._progress_timer.stop()
+            self._flush_progress()
+        elif not self._progress_timer.isActive():
+            self._progress_timer.start()
+
+    def _flush_progress(self):
+        """모아둔 최신 진행률 값을 프로그레스 바에 반영합니다."""
+        value = self._pending_progress
+        self._pending_progress = None
+        # 이미 표시 중인 값과 같으면 프로그레스 바를 다시 갱신하지 않습니다.
+        if value is not None and value != self._applied_progress:
+            self._applied_progress = value
+            self._set_progress(value)
 
     def on_worker_log_updated(self, message: str):
         """Worker로부터 로그 메시지를 받아 UI에 표시합니다."""
-        logging.log(USER_LOG_LEVEL, message)
+        self._logger.log(USER_LOG_LEVEL, message)
 
     @log_function_call
     def on_worker_finished(self):
         """Worker 작업이 정상적으로 완료되었을 때 호출됩니다."""
         self._timer.stop()  # 남은 시간 타이머 중지
-        self._view.update_time_label("-")  # 남은 시간 라벨 초기화
-
+        self._progress_timer.stop()  # 아직 반영되지 않은 진행률 갱신 취소
+        self._pending_progress = None
+        self._set_progress = None  # 바인딩해 둔 메서드 참조 해제
         elapsed_seconds = self._log_time_gap()  # 실제 소요 시간을 계산하고 로그에 기록
         self._save_completion_time(elapsed_seconds)  # 실제 소요 시간을 파일에 저장
 
-        logging.log(USER_LOG_LEVEL, "모든 작업이 완료되었습니다. 재부팅하시겠습니까?")
+        self._logger.log(USER_LOG_LEVEL, "모든 작업이 완료되었습니다. 재부팅하시겠습니까?")
+        self._release_worker()  # Worker 시그널 연결 해제 및 참조 제거
+
+        self._view.update_time_label("-")  # 남은 시간 라벨 초기화
         self._view.progress_bar.setValue(100)  # 프로그레스 바를 100%로 설정
         self._view.set_ui_for_task_running(False)  # UI를 작업 완료 상태로 변경
-        self._worker = None  # Worker 객체 참조 제거
-
-        # 작업 완료 후 데이터 보존 가능 여부를 다시 판단하여 버튼 상태를 업데이트합니다.
-        is_save_possible = (
-            self._system_info.system_volume_count == 1
-            and self._system_info.data_volume_index != -1
-            and self._system_info.boot_volume_index != -1
-        )
-        if is_save_possible:
+        # 작업 완료 후 데이터 보존 가능 여부에 따라 버튼 상태를 업데이트합니다.
+        if self._is_save_possible:
             self._view.set_data_save_enabled(True)
 
         # 재부팅 확인 대화상자를 표시합니다.
-        reboot_dialog = RebootDialog(self._view)
-        if reboot_dialog.exec():  # 사용자가 '지금 재시작'을 누른 경우
+        from dialog import RebootDialog  # 재부팅 대화상자 클래스
+        from utils import reboot_system  # 시스템 재부팅 유틸리티 함수
+
+        # 재부팅 대화상자도 한 번만 만들고, 다시 사용할 때는 카운트다운만 새로 시작합니다.
+        if self._reboot_dialog is None:
+            self._reboot_dialog = RebootDialog(self._view)
+        else:
+            self._reboot_dialog.start_countdown()
+        if self._reboot_dialog.exec():  # 사용자가 '지금 재시작'을 누른 경우
             logging.info("시스템을 재시작합니다.")
+            # 작업 시간 기록이 아직 진행 중일 수 있으므로 잠시(최대 2초) 완료를 기다립니다.
+            QThreadPool.globalInstance().waitForDone(2000)
             reboot_system()  # 시스템 재부팅 함수 호출
         else:  # 사용자가 '취소'를 누르거나 창을 닫은 경우
             logging.info("재시작이 취소되었습니다.")
@@ -280,19 +449,45 @@ class Controller:
     def on_worker_error(self, message: str):
         """Worker에서 오류가 발생했을 때 호출됩니다."""
         self._timer.stop()  # 타이머 중지
+        self._progress_timer.stop()  # 아직 반영되지 않은 진행률 갱신 취소
+        self._pending_progress = None
+        self._set_progress = None  # 바인딩해 둔 메서드 참조 해제
         self._view.update_time_label("-")  # 남은 시간 라벨 초기화
         self._log_time_gap()  # 오류 발생 시점까지의 소요 시간 기록
 
-        logging.log(USER_LOG_LEVEL, f"오류: {message}")
+        self._logger.log(USER_LOG_LEVEL, "오류: %s", message)
         self._view.set_ui_for_task_running(False)  # UI를 작업 완료(오류) 상태로 변경
+        self._release_worker()  # Worker 시그널 연결 해제 및 참조 제거
+
+    def _release_worker(self):
+        """
+        끝난 Worker의 시그널 연결을 모두 해제한 뒤 참조를 제거합니다.
+        종료 과정에서 뒤늦게 전달되는 시그널이 컨트롤러의 슬롯을 호출하지 않도록 합니다.
+        """
+        if self._worker is None:
+            return
+        for signal, slot in (
+            (self._worker.progress_updated, self.on_worker_progress_updated),
+            (self._worker.log_updated, self.on_worker_log_updated),
+            (self._worker.finished, self.on_worker_finished),
+            (self._worker.error_occurred, self.on_worker_error),
+        ):
+            try:
+                signal.disconnect(slot)
+            except TypeError:
+                pass  # 이미 연결이 해제된 경우 Qt가 TypeError를 발생시키므로 무시합니다.
         self._worker = None  # Worker 객체 참조 제거
 
     def _update_time_label(self):
-        """1초마다 호출되어 남은 예상 시간을 계산하고 UI 라벨을 업데이트합니다."""
-        if not self._start_time or not self._total_seconds:
+        """
+        남은 예상 시간을 계산하여 UI 라벨을 업데이트하고, 다음 초 경계에 맞춰 타이머를 다시 예약합니다.
+        창이 최소화되어 있으면 갱신 간격을 5초로 늘립니다.
+        """
+        if not self._start_time_ns or not self._total_seconds:
             return
 
-        elapsed_seconds = int(time.time() - self._start_time)  # 경과 시간 계산
+        elapsed_ms = (time.monotonic_ns() - self._start_time_ns) // 1_000_000
+        elapsed_seconds = elapsed_ms // 1000  # 경과 시간 계산
         remaining_seconds = self._total_seconds - elapsed_seconds  # 남은 시간 계산
 
         if remaining_seconds < 0:
@@ -302,36 +497,46 @@ class Controller:
         minutes, seconds = divmod(remaining_seconds, 60)
         # "MM:SS" 형식의 문자열로 만듭니다.
         time_str = f"{minutes:02d}:{seconds:02d}"
-        self._view.update_time_label(time_str)  # UI 라벨 업데이트
+        # 표시할 문자열이 바뀐 경우에만 UI 라벨을 업데이트합니다.
+        if time_str != self._last_time_str:
+            self._last_time_str = time_str
+            self._view.update_time_label(time_str)
+
+        # 남은 시간이 0이 되면 표시가 더 이상 바뀌지 않으므로 다시 예약하지 않습니다.
+        if remaining_seconds == 0:
+            return
+
+        # 다음 초 경계까지 남은 시간(ms)만큼 기다렸다가 다시 호출되도록 예약합니다.
+        if self._view.isMinimized():
+            delay_ms = 5000
+        else:
+            delay_ms = max(50, 1000 - elapsed_ms % 1000)
+        self._timer.start(delay_ms)
 
     def _log_time_gap(self) -> int:
         """
         예상 시간과 실제 소요 시간의 차이를 계산하여 로그에 기록하고,
         실제 소요된 시간을 초 단위로 반환합니다.
         """
-        if not self._start_time:
+        if not self._start_time_ns:
             return 0
 
-        elapsed_seconds = int(time.time() - self._start_time)  # 실제 소요 시간
-
-        if self._total_seconds > 0:
-            gap_seconds = (
-                self._total_seconds - elapsed_seconds
-            )  # 예상 시간과 실제 시간의 차이
+        # 실제 소요 시간 (정수 나노초 차이를 초 단위로 변환)
+        elapsed_seconds = (time.monotonic_ns() - self._start_time_ns) // 1_000_000_000
 
-            set_time_str = f"{self._total_seconds // 60}분 {self._total_seconds % 60}초"
-            elapsed_time_str = f"{elapsed_seconds // 60}분 {elapsed_seconds % 60}초"
+        # 예상 시간이 설정되지 않았으면 비교할 대상이 없으므로 문자열 생성을 건너뜁니다.
+        if self._total_seconds <= 0:
+            return elapsed_seconds
 
-            gap_abs_seconds = abs(gap_seconds)
-            gap_str = f"{gap_abs_seconds // 60}분 {gap_abs_seconds % 60}초"
+        gap_seconds = self._total_seconds - elapsed_seconds  # 예상 시간과 실제 시간의 차이
+        # 실제가 예상보다 빠르면 '빠름', 느리면 '느림'
+        gap_word = "빠름" if gap_seconds >= 0 else "느림"
 
-            if gap_seconds >= 0:
-                gap_summary = f"{gap_str} 빠름"  # 실제가 예상보다 빠름
-            else:
-                gap_summary = f"{gap_str} 느림"  # 실제가 예상보다 느림
-
-            log_message = f"시간 분석: 설정({set_time_str}) - 실제({elapsed_time_str}) = {gap_summary}"
-            logging.info(log_message)
+        logging.info(
+            f"시간 분석: 설정({_format_min_sec(self._total_seconds)}) - "
+            f"실제({_format_min_sec(elapsed_seconds)}) = "
+            f"{_format_min_sec(abs(gap_seconds))} {gap_word}"
+        )
 
         return elapsed_seconds
 
@@ -346,17 +551,22 @@ class Controller:
             )
             return
 
+        # 이전 기록과 거의 차이가 없으면 파일을 다시 쓰지 않습니다. (USB 메모리 쓰기 횟수 절약)
+        previous_seconds = self._system_info.estimated_time_sec
+        if (
+            previous_seconds > 0
+            and abs(elapsed_seconds - previous_seconds) < _COMPLETION_TIME_WRITE_THRESHOLD
+        ):
+            logging.info("작업 시간이 이전 기록과 비슷하여 저장을 생략합니다.")
+            return
+
         # 저장할 파일의 전체 경로를 생성합니다.
         time_file_path = os.path.join(
             self._system_info.driver_path, "completion_time.txt"
         )
-        try:
-            # 파일을 쓰기 모드로 열어 실제 소요 시간을 초 단위로 기록합니다.
-            with open(time_file_path, "w") as f:
-                f.write(str(elapsed_seconds))
-            logging.info(
-                f"작업 소요 시간({elapsed_seconds}초)을 '{time_file_path}'에 저장했습니다."
-            )
-        except IOError as e:
-            # 파일 쓰기 중 오류 발생 시 에러 로그를 기록합니다.
-            logging.error(f"작업 시간을 파일에 쓰는 중 오류가 발생했습니다: {e}")
+        # 파일 쓰기는 전역 스레드 풀에서 실행하여 UI 스레드가 디스크 I/O를 기다리지 않도록 합니다.
+        QThreadPool.globalInstance().start(
+            _CompletionTimeWriter(time_file_path, elapsed_seconds)
+        )
+        # 같은 세션에서 다시 작업할 때 최신 기록과 비교하도록, 기록을 요청한 소요 시간을 이전 기록으로 갱신합니다.
+        self._system_info.estimated_time_sec = elapsed_seconds
@@ -1,5 +1,8 @@
 # dialog.py
 
+# time 모듈: 재부팅 카운트다운의 남은 시간을 monotonic 시계로 계산하는 데 사용합니다.
+import time
+
 # PyQt6.QtWidgets 모듈에서 대화상자(Dialog) 및 관련 위젯들을 가져옵니다.
 from PyQt6.QtWidgets import (
     QDialog,
@@ -7,33 +10,12 @@ from PyQt6.QtWidgets import (
     QDialogButtonBox,
     QLabel,
     QVBoxLayout,
-    QMessageBox,
 )
 
-# PyQt6.QtCore 모듈에서 QTimer 클래스를 가져옵니다.
+# PyQt6.QtCore 모듈에서 Qt, QTimer 클래스를 가져옵니다.
+# Qt: 타이머 정밀도(TimerType) 등 Qt 전역 상수를 제공합니다.
 # QTimer: 일정 시간 간격으로 특정 동작을 실행하게 해주는 타이머입니다.
-from PyQt6.QtCore import QTimer
-
-
-def show_message_box(level: str, title: str, message: str, parent=None):
-    """
-    간단한 정보, 경고, 오류 메시지를 표시하는 메시지 상자를 보여주는 헬퍼 함수입니다.
-    (현재 이 프로젝트에서는 직접적으로 사용되고 있지는 않지만, 유틸리티 함수로 정의되어 있습니다.)
-
-    Args:
-        level (str): 메시지 박스의 종류 ('info', 'warning', 'critical').
-        title (str): 메시지 박스 창의 제목.
-        message (str): 표시할 메시지 내용.
-        parent (QWidget, optional): 부모 위젯. Defaults to None.
-    """
-    if level == "info":
-        QMessageBox.information(parent, title, message)
-    elif level == "warning":
-        QMessageBox.warning(parent, title, message)
-    elif level == "critical":
-        QMessageBox.critical(parent, title, message)
-    else:  # 기본값은 정보 메시지 박스
-        QMessageBox.information(parent, title, message)
+from PyQt6.QtCore import Qt, QTimer
 
 
 class ConfirmationDialog(QDialog):
@@ -82,15 +64,19 @@ class ConfirmationDialog(QDialog):
 
         layout.addWidget(self.button_box)
 
+    def reset(self):
+        """대화상자를 다시 사용할 수 있도록 입력 내용을 지우고 'OK' 버튼을 비활성화합니다."""
+        self.input_field.clear()
+        self.ok_button.setEnabled(False)
+
     def _validate_input(self, text: str):
         """사용자가 입력한 텍스트를 검증하여 'OK' 버튼의 활성화 여부를 결정하는 슬롯입니다."""
-        # 입력된 텍스트가 "960601"과 일치하는지 확인합니다.
-        if text == "960601":
-            # 일치하면 'OK' 버튼을 활성화합니다.
-            self.ok_button.setEnabled(True)
-        else:
-            # 일치하지 않으면 'OK' 버튼을 비활성화합니다.
-            self.ok_button.setEnabled(False)
+        # 입력된 텍스트가 "960601"과 일치하면 'OK' 버튼을 활성화하고, 아니면 비활성화합니다.
+        # 길이가 다르면 문자열 비교 없이 바로 불일치로 판단합니다.
+        should_enable = len(text) == 6 and text == "960601"
+        # 버튼 상태가 실제로 바뀌는 경우에만 setEnabled를 호출합니다. (매 키 입력마다의 불필요한 갱신 방지)
+        if self.ok_button.isEnabled() != should_enable:
+            self.ok_button.setEnabled(should_enable)
 
 
 class RebootDialog(QDialog):
@@ -106,8 +92,9 @@ class RebootDialog(QDialog):
         self.setModal(True)
         self.resize(350, 150)  # 대화상자의 크기를 적절하게 조절
 
-        # 재부팅까지 남은 시간을 초 단위로 저장하는 변수
+        # 재부팅까지의 카운트다운 시간(초)과, 재부팅 예정 시각(monotonic 나노초)
         self.countdown = 10
+        self.deadline_ns = 0
 
         layout = QVBoxLayout(self)
         # 카운트다운 메시지를 표시할 QLabel 위젯 생성
@@ -125,33 +112,45 @@ class RebootDialog(QDialog):
         self.button_box.rejected.connect(self.reject)
         layout.addWidget(self.button_box)
 
-        # 1초마다 _update_countdown 메서드를 호출할 QTimer를 생성하고 시작합니다.
+        # 카운트다운이 끝나는 시점에 한 번만 accept()를 호출하는 단발성 타이머입니다.
+        self.deadline_timer = QTimer(self)
+        self.deadline_timer.setSingleShot(True)
+        self.deadline_timer.timeout.connect(self.accept)
+
+        # 1초마다 남은 시간 메시지만 갱신하는 타이머입니다.
+        # 남은 시간은 매번 재부팅 예정 시각으로부터 다시 계산하므로 오차가 누적되지 않습니다.
+        # 초 단위 표시에는 높은 정밀도가 필요 없으므로 CoarseTimer로 설정하여 시스템 타이머 부담을 줄입니다.
         self.timer = QTimer(self)
+        self.timer.setTimerType(Qt.TimerType.CoarseTimer)
         self.timer.timeout.connect(self._update_countdown)
-        self.timer.start(1000)
 
+        self.start_countdown()
+
+    def start_countdown(self):
+        """카운트다운을 처음부터 시작합니다. 대화상자를 다시 사용할 때도 exec() 전에 호출합니다."""
+        self.deadline_ns = time.monotonic_ns() + self.countdown * 1_000_000_000
+        self.deadline_timer.start(self.countdown * 1000)
+        self.timer.start(1000)
         # 대화상자가 나타나자마자 첫 카운트다운 메시지를 표시하기 위해 메서드를 한 번 호출합니다.
         self._update_countdown()
 
     def _update_countdown(self):
-        """1초마다 호출되어 카운트다운 숫자를 업데이트하고 0이 되면 자동으로 accept()를 호출하는 슬롯입니다."""
-        if self.countdown > 0:
-            # 남은 시간이 1초 이상이면 메시지를 업데이트하고 카운트다운 값을 1 감소시킵니다.
-            self.message_label.setText(
-                f"모든 작업이 완료되었습니다.\n{self.countdown}초 후 시스템을 재시작합니다."
-            )
-            self.countdown -= 1
-        else:
-            # 카운트다운이 0이 되면 타이머를 멈추고 accept()를 호출하여 재부팅을 진행합니다.
-            self.timer.stop()
-            self.accept()
+        """1초마다 호출되어 재부팅 예정 시각까지 남은 시간(초)을 메시지에 표시하는 슬롯입니다."""
+        remaining_ns = self.deadline_ns - time.monotonic_ns()
+        # 남은 시간을 초 단위로 올림하여 표시합니다. (예: 9.2초 -> 10초)
+        remaining_seconds = max(0, -(-remaining_ns // 1_000_000_000))
+        self.message_label.setText(
+            f"모든 작업이 완료되었습니다.\n{remaining_seconds}초 후 시스템을 재시작합니다."
+        )
 
     def accept(self):
         """'지금 재시작' 버튼을 누르거나 카운트다운이 완료되었을 때 호출됩니다."""
         self.timer.stop()  # 혹시 타이머가 실행 중이면 멈춥니다.
+        self.deadline_timer.stop()
         super().accept()  # 부모 클래스의 accept()를 호출하여 대화상자를 닫고 QDialog.Accepted를 반환합니다.
 
     def reject(self):
         """'취소' 버튼을 눌렀을 때 호출됩니다."""
         self.timer.stop()  # 카운트다운 타이머를 멈춥니다.
+        self.deadline_timer.stop()  # 자동 재시작 타이머도 멈춥니다.
         super().reject()  # 부모 클래스의 reject()를 호출하여 대화상자를 닫고 QDialog.Rejected를 반환합니다.
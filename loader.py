@@ -1,78 +1,141 @@
 # loader.py
 
+# functools 모듈: 메인보드 모델명 조회 결과를 캐시하는 lru_cache 데코레이터를 제공합니다.
+import functools
+
 # os 모듈: 파일 경로 생성, 디렉토리 존재 여부 확인 등 운영체제 관련 기능을 제공합니다.
 import os
 
-# re 모듈: 정규 표현식을 사용하여 문자열에서 특정 패턴을 찾거나 수정하는 데 사용됩니다.
-import re
+# concurrent.futures 모듈: 여러 볼륨의 폴더 검사를 스레드 풀에서 동시에 실행하는 데 사용합니다.
+from concurrent.futures import ThreadPoolExecutor
 
-import winreg
 # typing 모듈: 타입 힌트를 제공하여 코드의 가독성과 유지보수성을 향상시킵니다.
-from typing import List, Dict, Tuple
+from typing import List, Dict, Optional, Tuple
 
 # PyQt6.QtCore 모듈: Qt의 핵심 기능을 담고 있습니다.
-# QThread: 시간이 오래 걸리는 작업을 별도 스레드에서 실행하여 GUI가 멈추는 것을 방지합니다.
+# QObject: 시그널을 정의하기 위한 기본 클래스입니다. (QRunnable은 QObject가 아니므로 시그널용 객체를 따로 둡니다.)
+# QRunnable: 스레드 풀(QThreadPool)에서 실행할 작업을 정의하는 클래스입니다.
 # pyqtSignal: 스레드 간 안전한 통신을 위한 신호를 정의합니다.
-from PyQt6.QtCore import QThread, pyqtSignal
+from PyQt6.QtCore import QObject, QRunnable, pyqtSignal
 
 # models.py와 utils.py에서 필요한 클래스와 함수를 가져옵니다.
-from models import DiskInfo, SystemInfo
+from models import DiskInfo, VolumeInfo, SystemInfo
 import utils
 
+# 폴더 이름에 사용할 수 없는 문자(\ / : * ? " < > |)를 제거하기 위한 변환 테이블
+_INVALID_PATH_CHARS_TABLE = str.maketrans("", "", '\\/:*?"<>|')
+# 볼륨 폴더 검사를 동시에 실행할 최대 스레드 수
+_MAX_PROBE_WORKERS = 8
+
 
-class Loader(QThread):
+@functools.lru_cache(maxsize=1)
+def _read_board_product_name() -> str:
     """
-    프로그램 시작 시 시스템의 하드웨어 정보를 분석하는 작업을 수행하는 스레드.
-    UI 스레드와 분리하여 프로그램이 멈추는 현상을 방지합니다.
+    레지스트리에서 메인보드 모델명을 읽어 반환합니다.
+    모델명은 실행 중에 바뀌지 않으므로 결과를 캐시하여, 같은 프로세스에서 분석을 다시 실행할 때는 레지스트리를 다시 읽지 않습니다.
+    (모델명을 읽지 못하면 예외가 발생하며, 이 경우는 캐시되지 않습니다.)
     """
+    # winreg 모듈: Windows 레지스트리에 접근하는 모듈입니다.
+    # Windows 전용 모듈이며 이 함수에서만 사용하므로, 실제로 필요할 때 가져옵니다.
+    import winreg
+
+    board_product_name = ""
+
+    # 레지스트리 경로: HKEY_LOCAL_MACHINE\HARDWARE\DESCRIPTION\System\BIOS
+    key_path = r"HARDWARE\DESCRIPTION\System\BIOS"
+
+    try:
+        # winreg를 사용하여 레지스트리 키를 엽니다.
+        with winreg.OpenKey(winreg.HKEY_LOCAL_MACHINE, key_path) as key:
+            # 'BaseBoardProduct' 값을 읽어옵니다. (대부분의 메인보드 모델명)
+            try:
+                board_product_name, _ = winreg.QueryValueEx(key, "BaseBoardProduct")
+            except FileNotFoundError:
+                # BaseBoardProduct가 없는 경우 'SystemProductName'을 시도합니다.
+                board_product_name, _ = winreg.QueryValueEx(key, "SystemProductName")
+    except Exception:
+        # 레지스트리 접근 실패 혹은 키를 찾을 수 없는 경우 무시하고 빈 문자열 유지
+        pass
+
+    if not board_product_name:
+        raise RuntimeError("레지스트리를 통해 메인보드 모델명을 가져올 수 없습니다.")
+    return board_product_name
+
+
+class _LoaderSignals(QObject):
+    """Loader(QRunnable)는 시그널을 가질 수 없으므로, Loader의 시그널을 대신 정의하는 클래스입니다."""
 
     # finished 시그널: 작업이 성공적으로 완료되었을 때 SystemInfo 객체를 담아 Controller로 전달합니다.
     finished = pyqtSignal(object)
     # error_occurred 시그널: 작업 중 오류가 발생했을 때 오류 메시지(문자열)를 Controller로 전달합니다.
     error_occurred = pyqtSignal(str)
 
+
+class Loader(QRunnable):
+    """
+    프로그램 시작 시 시스템의 하드웨어 정보를 분석하는 작업.
+    QThreadPool에서 실행되어 UI 스레드와 분리되므로 프로그램이 멈추는 현상을 방지하며,
+    다시 분석할 때는 새 스레드를 만들지 않고 스레드 풀의 스레드를 재사용합니다.
+    """
+
+    # _parser: diskpart 상세 정보 파서 (상태가 없으므로 모든 Loader가 하나의 인스턴스를 공유합니다.)
+    _parser = utils.Parser()
+
+    def __init__(self):
+        """Loader 클래스의 생성자입니다."""
+        super().__init__()
+        # 같은 Loader 객체를 여러 번 실행할 수 있도록, 실행이 끝나도 스레드 풀이 객체를 삭제하지 않게 합니다.
+        self.setAutoDelete(False)
+        # 시그널 객체를 만들고, 기존과 같이 loader.finished / loader.error_occurred로 연결할 수 있게 노출합니다.
+        self._signals = _LoaderSignals()
+        self.finished = self._signals.finished
+        self.error_occurred = self._signals.error_occurred
+
     def run(self):
         """
-        QThread.start()가 호출되면 실행되는 메인 메서드입니다.
+        QThreadPool.start()로 실행되면 스레드 풀의 스레드에서 호출되는 메인 메서드입니다.
         시스템 분석 작업의 전체 흐름을 제어하며, 일련의 과정을 순차적으로 실행합니다.
         """
-        try:
-            # 1. diskpart를 이용해 기본적인 디스크 목록(인덱스)과 크기 정보를 가져옵니다.
-            disk_indices, disk_sizes = self._get_base_disk_info()
-            # 2. 각 디스크의 상세 정보(볼륨 목록 포함)를 가져옵니다.
-            detail_output = self._get_detailed_disk_info(disk_indices)
-            # 3. diskpart의 텍스트 출력을 파싱하여 DiskInfo 객체 리스트로 변환합니다.
-            parsed_disks = self._parse_disk_details(detail_output, disk_sizes)
-
-            # --- [수정 1] 디스크 전체 크기 보정 로직 ---
-            # detail disk의 볼륨 크기 합산으로 부정확한 list disk 크기 정보를 덮어씁니다.
-            for disk in parsed_disks:
-                if disk.size_gb == 0.0 and disk.volumes:
-                    total_volume_size = sum(v.size_gb for v in disk.volumes)
-                    if total_volume_size > 0:
-                        disk.size_gb = round(total_volume_size, 2)
-
-            # 4. 드라이브 문자가 없는 볼륨에 임시 드라이브 문자를 할당하여 내용에 접근할 수 있도록 합니다.
-            disks_with_letters = self._assign_drive_letters(parsed_disks)
-            # 5. 분석 대상에서 USB 디스크를 제외합니다.
-            internal_disks = self._filter_out_usb_disks(disks_with_letters)
-            # 6. 각 볼륨의 역할을 폴더 구조를 기반으로 System, Data, Boot 등으로 분류합니다.
-            classified_disks = self._classify_volumes(internal_disks)
-            # 7. WMI를 통해 메인보드 모델명을 조회하고, 일치하는 드라이버 폴더 경로를 찾습니다.
-            driver_path = self._get_driver_path()
-            # 8. 드라이버 폴더에 저장된 이전 작업의 소요 시간(completion_time.txt)을 읽어옵니다.
-            estimated_time = self._read_completion_time(driver_path)
-            # 9. 위에서 분석된 모든 정보를 종합하여 최종적으로 SystemInfo 객체를 생성합니다.
-            system_info = self._extract_system_info(
-                classified_disks, driver_path, estimated_time
-            )
+        # 드라이버 폴더 조회(레지스트리 + Drivers 폴더 검색)와 이전 작업 시간 읽기는 디스크 분석과 무관하므로,
+        # 별도 스레드에서 먼저 시작해 두고 diskpart 작업과 동시에 진행되도록 합니다.
+        with ThreadPoolExecutor(max_workers=1) as executor:
+            driver_future = executor.submit(self._get_driver_info)
+            try:
+                # 1. diskpart를 이용해 기본적인 디스크 목록(인덱스)과 크기 정보를 가져옵니다.
+                disk_indices, disk_sizes = self._get_base_disk_info()
+                # 2. 각 디스크의 상세 정보(볼륨 목록 포함)를 가져옵니다.
+                detail_output = self._get_detailed_disk_info(disk_indices)
+                # 3. diskpart의 텍스트 출력을 파싱하여 DiskInfo 객체 리스트로 변환합니다.
+                parsed_disks = self._parse_disk_details(detail_output, disk_sizes)
+
+                # --- [수정 1] 디스크 전체 크기 보정 로직 ---
+                # detail disk의 볼륨 크기 합산으로 부정확한 list disk 크기 정보를 덮어씁니다.
+                for disk in parsed_disks:
+                    if disk.size_gb == 0.0 and disk.volumes:
+                        total_volume_size = sum(v.size_gb for v in disk.volumes)
+                        if total_volume_size > 0:
+                            disk.size_gb = round(total_volume_size, 2)
+
+                # 4. 드라이브 문자가 없는 볼륨에 임시 드라이브 문자를 할당하여 내용에 접근할 수 있도록 합니다.
+                disks_with_letters = self._assign_drive_letters(parsed_disks)
+                # 5. 분석 대상에서 USB 디스크를 제외합니다.
+                internal_disks = self._filter_out_usb_disks(disks_with_letters)
+                # 6. 각 볼륨의 역할을 폴더 구조를 기반으로 System, Data, Boot 등으로 분류합니다.
+                classified_disks = self._classify_volumes(internal_disks)
+                # 7~8. 미리 시작해 둔 드라이버 폴더 경로와 이전 작업 소요 시간(completion_time.txt) 결과를 받습니다.
+                #      (조회 중 발생한 예외는 여기서 다시 발생합니다.)
+                driver_path, estimated_time = driver_future.result()
+                # 9. 위에서 분석된 모든 정보를 종합하여 최종적으로 SystemInfo 객체를 생성합니다.
+                system_info = self._extract_system_info(
+                    classified_disks, driver_path, estimated_time
+                )
 
-            # 10. 분석 완료를 알리는 'finished' 시그널에 SystemInfo 객체를 담아 보냅니다.
-            self.finished.emit(system_info)
+                # 10. 분석 완료를 알리는 'finished' 시그널에 SystemInfo 객체를 담아 보냅니다.
+                self.finished.emit(system_info)
 
-        except Exception as e:
-            # 작업 중 발생한 모든 예외를 잡아 'error_occurred' 시그널로 오류 메시지를 보냅니다.
-            self.error_occurred.emit(str(e))
+            except Exception as e:
+                # 작업 중 발생한 모든 예외를 잡아 'error_occurred' 시그널로 오류 메시지를 보냅니다.
+                self.error_occurred.emit(str(e))
 
     def _get_base_disk_info(self) -> Tuple[List[str], Dict[str, str]]:
         """Diskpart를 실행하여 시스템의 기본 디스크 목록과 크기 정보를 가져옵니다."""
@@ -103,36 +166,77 @@ class Loader(QThread):
         self, detail_output: str, disk_sizes: Dict[str, str]
     ) -> List[DiskInfo]:
         """Diskpart의 상세 정보 텍스트 출력을 utils.Parser를 이용해 DiskInfo 객체 리스트로 변환합니다."""
-        parser = utils.Parser()
-        return parser.parse(detail_output, disk_sizes)
+        return self._parser.parse(detail_output, disk_sizes)
 
     def _assign_drive_letters(self, disks: List[DiskInfo]) -> List[DiskInfo]:
-        """드라이브 문자가 없는 볼륨에 E:부터 시작하는 임시 드라이브 문자를 할당합니다."""
-        available_letters = [chr(ord("E") + i) for i in range(22)]
+        """
+        드라이브 문자가 없는 볼륨에 E:부터 시작하는 임시 드라이브 문자를 할당합니다.
+        모든 할당 명령을 하나의 스크립트로 묶어 diskpart를 한 번만 실행합니다.
+        """
+        # 이미 사용 중인 문자를 집합으로 모은 뒤, 사용 가능한 문자(E~Z)를 처음부터 역순으로 만듭니다.
+        # (pop()으로 뒤에서 꺼내면 E부터 차례로 할당되므로 따로 정렬할 필요가 없습니다.)
+        used_letters = {
+            volume.letter for disk in disks for volume in disk.volumes if volume.letter
+        }
+        available_letters = [
+            letter
+            for letter in map(chr, range(ord("Z"), ord("E") - 1, -1))
+            if letter not in used_letters
+        ]
 
+        # 1. diskpart를 실행하지 않고 (볼륨, 할당할 문자) 쌍을 먼저 모두 정합니다.
+        assignments = []
         for disk in disks:
             for volume in disk.volumes:
-                if volume.letter and volume.letter in available_letters:
-                    available_letters.remove(volume.letter)
+                if not volume.letter and available_letters:
+                    assignments.append((volume, available_letters.pop()))
 
-        available_letters.sort(reverse=True)
+        if not assignments:
+            return disks
 
-        for disk in disks:
-            for volume in disk.volumes:
-                if not volume.letter and available_letters:
-                    new_letter = available_letters.pop()
-                    script = f"select volume {volume.index}\nassign letter={new_letter}"
-                    success, _ = utils.run_diskpart_script(script)
-                    if success:
-                        volume.letter = new_letter
-                    else:
-                        available_letters.append(new_letter)
-                        available_letters.sort(reverse=True)
+        # 2. 모든 할당 명령을 하나의 스크립트로 묶어 diskpart를 한 번만 실행합니다.
+        script = "\n".join(
+            f"select volume {volume.index}\nassign letter={letter}"
+            for volume, letter in assignments
+        )
+        success, _ = utils.run_diskpart_script(script)
+        if success:
+            for volume, letter in assignments:
+                volume.letter = letter
+            return disks
+
+        # 3. 묶음 실행이 실패해도 일부 볼륨에는 이미 문자가 할당되었을 수 있습니다.
+        #    (이런 볼륨에 다시 할당하면 오류가 나므로) 디스크 상세 정보를 다시 읽어 실제 문자를 먼저 반영하고,
+        #    아직 문자가 없는 볼륨만 하나씩 다시 할당하여 성공한 볼륨에만 문자를 기록합니다.
+        current_letters = self._read_volume_letters([str(disk.index) for disk in disks])
+        for volume, letter in assignments:
+            if current_letters.get(volume.index):
+                volume.letter = current_letters[volume.index]
+                continue
+            script = f"select volume {volume.index}\nassign letter={letter}"
+            success, _ = utils.run_diskpart_script(script)
+            if success:
+                volume.letter = letter
         return disks
 
+    def _read_volume_letters(self, disk_indices: List[str]) -> Dict[int, str]:
+        """
+        주어진 디스크들의 상세 정보를 다시 읽어 {볼륨 번호: 현재 드라이브 문자} 딕셔너리를 반환합니다.
+        diskpart 실행에 실패하면 빈 딕셔너리를 반환합니다.
+        """
+        try:
+            detail_output = self._get_detailed_disk_info(disk_indices)
+        except RuntimeError:
+            return {}
+        return {
+            volume.index: volume.letter
+            for disk in self._parse_disk_details(detail_output, {})
+            for volume in disk.volumes
+        }
+
     def _filter_out_usb_disks(self, disks: List[DiskInfo]) -> List[DiskInfo]:
         """디스크 목록에서 'USB' 타입의 디스크를 필터링하여 제외합니다."""
-        return [disk for disk in disks if "USB" not in disk.type.upper()]
+        return [disk for disk in disks if not disk.is_usb]
 
     def _classify_volumes(self, disks: List[DiskInfo]) -> List[DiskInfo]:
         """
@@ -140,99 +244,137 @@ class Loader(QThread):
         """
         system_candidates = []
         data_candidates = []
-
-        for disk in disks:
-            for volume in disk.volumes:
-                if not volume.letter:
-                    continue
-
-                root = f"{volume.letter}:\\"
-                sys_paths = {
-                    "sysprep": os.path.join(root, "Windows", "system32", "sysprep"),
-                    "desktop": os.path.join(root, "Users", "kdic", "desktop"),
-                    "appdata": os.path.join(root, "Users", "kdic", "appdata"),
-                }
-                if all(os.path.isdir(p) for p in sys_paths.values()):
+        # 첫 번째 System 볼륨 후보가 속한 디스크 (Boot 볼륨을 찾는 데 사용)
+        system_disk = None
+        # Data 볼륨 후보별 kdic 폴더 항목 {id(볼륨): DirEntry} (생성 시각 비교가 필요할 때만 stat()을 호출합니다.)
+        data_entries = {}
+
+        # 드라이브 문자가 있는 볼륨만 검사 대상이며, 각 볼륨이 속한 디스크를 함께 기록해 둡니다.
+        targets = [
+            (disk, volume)
+            for disk in disks
+            for volume in disk.volumes
+            if volume.letter
+        ]
+        if targets:
+            # 볼륨마다 폴더 검사를 스레드 풀에서 동시에 실행하여, 여러 디스크의 I/O 대기 시간이 겹치도록 합니다.
+            # (executor.map은 입력 순서대로 결과를 돌려주므로 후보 목록의 순서는 기존과 같습니다.)
+            with ThreadPoolExecutor(
+                max_workers=min(len(targets), _MAX_PROBE_WORKERS)
+            ) as executor:
+                results = list(
+                    executor.map(self._probe_volume, [volume for _, volume in targets])
+                )
+            for (disk, volume), (is_system, is_data, kdic_entry) in zip(targets, results):
+                if is_system:
+                    if system_disk is None:
+                        system_disk = disk
                     system_candidates.append(volume)
-
-                kdic_desktop_path = os.path.join(root, "kdic", "desktop")
-                kdic_downloads_path = os.path.join(root, "kdic", "downloads")
-                if os.path.isdir(kdic_desktop_path) and os.path.isdir(
-                    kdic_downloads_path
-                ):
+                if is_data:
                     data_candidates.append(volume)
+                    data_entries[id(volume)] = kdic_entry
 
         for vol in system_candidates:
             vol.volume_type = "System"
 
-        system_volume = system_candidates[0] if system_candidates else None
         data_candidates = [
             vol for vol in data_candidates if vol.volume_type != "System"
         ]
 
         if len(data_candidates) > 1:
+            # kdic 폴더가 가장 최근에 만들어진 볼륨을 Data 볼륨으로 지정합니다.
+            # (검사 단계에서 받아 둔 DirEntry로 생성 시각을 읽으며, Windows에서는 목록 조회 결과를 재사용하므로 추가 조회가 없습니다.)
             try:
                 data_volume = max(
                     data_candidates,
-                    key=lambda vol: os.path.getctime(
-                        os.path.join(f"{vol.letter}:\\", "kdic")
-                    ),
+                    key=lambda vol: data_entries[id(vol)].stat().st_ctime,
                 )
-                data_volume.volume_type = "Data"
-            except FileNotFoundError as e:
+            except OSError as e:
                 raise RuntimeError(
                     f"데이터 볼륨 날짜 비교 중 폴더를 찾을 수 없습니다: {e}"
                 )
+            data_volume.volume_type = "Data"
         elif len(data_candidates) == 1:
             data_candidates[0].volume_type = "Data"
 
-        if system_volume:
-            system_disk_index = -1
-            for disk in disks:
-                if system_volume in disk.volumes:
-                    system_disk_index = disk.index
+        # System 볼륨이 있는 디스크에서, 아직 분류되지 않은 첫 번째 FAT 볼륨을 Boot 볼륨으로 지정합니다.
+        # (System 볼륨이 속한 디스크는 검사 단계에서 기록해 두었으므로 디스크 목록을 다시 찾지 않습니다.)
+        if system_disk is not None:
+            for volume in system_disk.volumes:
+                if not volume.volume_type and "FAT" in volume.filesystem.upper():
+                    volume.volume_type = "Boot"
                     break
-
-            if system_disk_index != -1:
-                for disk in disks:
-                    if disk.index == system_disk_index:
-                        for volume in disk.volumes:
-                            if (
-                                not volume.volume_type
-                                and "FAT" in volume.filesystem.upper()
-                            ):
-                                volume.volume_type = "Boot"
-                                break
         return disks
 
-    def _get_driver_path(self) -> str:
+    def _probe_volume(
+        self, volume: VolumeInfo
+    ) -> Tuple[bool, bool, Optional[os.DirEntry]]:
         """
-        레지스트리를 사용하여 메인보드 모델명을 조회하고, 일치하는 드라이버 폴더 경로를 반환합니다.
-        (WMI 의존성 제거됨)
+        볼륨의 폴더 구조를 검사하여 (System 볼륨 후보 여부, Data 볼륨 후보 여부, kdic 폴더 항목)을 반환합니다.
+        kdic 폴더 항목(DirEntry)은 Data 볼륨 후보일 때만 반환하며, 아니면 None입니다.
+        스레드 풀에서 여러 볼륨에 대해 동시에 호출됩니다.
         """
-        board_product_name = ""
-        
-        # 레지스트리 경로: HKEY_LOCAL_MACHINE\HARDWARE\DESCRIPTION\System\BIOS
-        key_path = r"HARDWARE\DESCRIPTION\System\BIOS"
+        # root는 항상 "X:\\" 형태이므로, 하위 경로는 os.path.join 대신 f-string으로 바로 만듭니다.
+        root = f"{volume.letter}:\\"
+        # 볼륨 루트의 하위 폴더 목록을 한 번만 읽어 두고, 필요한 폴더가 있을 때만 더 내려갑니다.
+        root_dirs = self._list_subdirs(root)
+
+        # System 볼륨: Users\kdic 아래의 desktop/appdata는 한 번의 목록 조회로 확인하고,
+        # 두 폴더가 모두 있을 때만 Windows\system32\sysprep 폴더를 확인합니다.
+        # (system32는 항목이 매우 많으므로 목록을 읽지 않고 isdir로 직접 확인합니다.)
+        is_system = False
+        if "users" in root_dirs and "windows" in root_dirs:
+            user_dirs = self._list_subdirs(f"{root}Users\\kdic")
+            is_system = (
+                "desktop" in user_dirs
+                and "appdata" in user_dirs
+                and os.path.isdir(f"{root}Windows\\system32\\sysprep")
+            )
+
+        # System 볼륨은 어차피 Data 후보에서 제외되므로 Data 검사를 생략합니다.
+        if is_system:
+            return True, False, None
 
+        # Data 볼륨: kdic 폴더 아래의 desktop/downloads를 한 번의 목록 조회로 확인합니다.
+        if "kdic" in root_dirs:
+            kdic_dirs = self._list_subdirs(f"{root}kdic")
+            if "desktop" in kdic_dirs and "downloads" in kdic_dirs:
+                # 루트 목록을 읽을 때 받아 둔 kdic 폴더 항목을 함께 돌려주어,
+                # Data 후보가 여러 개일 때만 이 항목으로 생성 시각을 읽도록 합니다.
+                return False, True, root_dirs["kdic"]
+
+        return False, False, None
+
+    def _list_subdirs(self, path: str) -> Dict[str, os.DirEntry]:
+        """
+        주어진 경로의 하위 폴더들을 {소문자 이름: DirEntry} 딕셔너리로 모아 반환합니다.
+        (Windows 경로는 대소문자를 구분하지 않으므로 소문자로 비교합니다.)
+        경로가 없거나 읽을 수 없으면 빈 딕셔너리를 반환합니다.
+        """
         try:
-            # winreg를 사용하여 레지스트리 키를 엽니다.
-            with winreg.OpenKey(winreg.HKEY_LOCAL_MACHINE, key_path) as key:
-                # 'BaseBoardProduct' 값을 읽어옵니다. (대부분의 메인보드 모델명)
-                try:
-                    board_product_name, _ = winreg.QueryValueEx(key, "BaseBoardProduct")
-                except FileNotFoundError:
-                    # BaseBoardProduct가 없는 경우 'SystemProductName'을 시도합니다.
-                    board_product_name, _ = winreg.QueryValueEx(key, "SystemProductName")
-        except Exception:
-            # 레지스트리 접근 실패 혹은 키를 찾을 수 없는 경우 무시하고 빈 문자열 유지
-            pass
+            with os.scandir(path) as entries:
+                return {
+                    entry.name.lower(): entry for entry in entries if entry.is_dir()
+                }
+        except OSError:
+            return {}
+
+    def _get_driver_info(self) -> Tuple[str, int]:
+        """드라이버 폴더 경로와, 그 폴더에 저장된 이전 작업 소요 시간(초)을 함께 반환합니다."""
+        # 7. 레지스트리를 통해 메인보드 모델명을 조회하고, 일치하는 드라이버 폴더 경로를 찾습니다.
+        driver_path = self._get_driver_path()
+        # 8. 드라이버 폴더에 저장된 이전 작업의 소요 시간(completion_time.txt)을 읽어옵니다.
+        return driver_path, self._read_completion_time(driver_path)
 
-        if not board_product_name:
-            raise RuntimeError("레지스트리를 통해 메인보드 모델명을 가져올 수 없습니다.")
+    def _get_driver_path(self) -> str:
+        """
+        레지스트리를 사용하여 메인보드 모델명을 조회하고, 일치하는 드라이버 폴더 경로를 반환합니다.
+        (WMI 의존성 제거됨)
+        """
+        board_product_name = _read_board_product_name()
 
         # 모델명에서 특수문자를 제거하고 공백을 정리합니다.
-        clean_name = re.sub(r'[\\/:*?"<>|]', "", board_product_name).strip()
+        clean_name = board_product_name.translate(_INVALID_PATH_CHARS_TABLE).strip()
         
         # 드라이버 폴더 경로 설정 (현재 작업 디렉토리의 상위 폴더 -> Drivers)
         drivers_base_path = os.path.join(os.path.dirname(os.getcwd()), "Drivers")
@@ -248,37 +390,35 @@ class Loader(QThread):
 
     def _find_path_by_prefix(self, base_path: str, prefix: str) -> str:
         """주어진 경로에서 특정 접두사로 시작하는 하위 폴더 경로를 찾습니다."""
-        if not os.path.isdir(base_path):
-            return ""
-        for item in os.listdir(base_path):
-            if item.lower().startswith(prefix.lower()):
-                full_path = os.path.join(base_path, item)
-                if os.path.isdir(full_path):
-                    return full_path
+        # Windows 폴더 이름은 대소문자를 구분하지 않으므로 casefold로 비교합니다.
+        # (lower보다 유니코드 문자의 대소문자 비교가 정확합니다.)
+        prefix_folded = prefix.casefold()
+        try:
+            # os.scandir는 항목의 종류(폴더 여부)를 함께 읽어오므로 항목마다 따로 stat을 호출하지 않습니다.
+            with os.scandir(base_path) as entries:
+                for entry in entries:
+                    if entry.name.casefold().startswith(prefix_folded) and entry.is_dir():
+                        return entry.path
+        except OSError:
+            # base_path가 없거나 폴더가 아니면 찾지 못한 것으로 처리합니다.
+            pass
         return ""
 
     def _read_completion_time(self, driver_path: str) -> int:
         """저장된 이전 작업 소요 시간을 읽어옵니다."""
         time_file_path = os.path.join(driver_path, "completion_time.txt")
-        if os.path.exists(time_file_path):
+        # 존재 여부를 따로 확인하지 않고 바로 열어봅니다. 파일이 없으면 OSError로 처리됩니다.
+        # 파일에는 정수 하나만 있으므로, 버퍼링된 파일 객체 없이 os.open/os.read로 최대 32바이트만 읽습니다.
+        # (int()는 바이트 문자열 앞뒤의 공백과 줄바꿈을 스스로 무시합니다.)
+        try:
+            fd = os.open(time_file_path, os.O_RDONLY | getattr(os, "O_BINARY", 0))
             try:
-                with open(time_file_path, "r") as f:
-                    return int(f.read().strip())
-            except (ValueError, IOError):
-                return 0
-        return 0
-
-    def _get_disk_priority(self, disk: DiskInfo) -> int:
-        """
-        디스크 정렬을 위한 우선순위 정수를 반환합니다. (낮을수록 우선순위 높음)
-        NVMe (0) > SSD (1) > 기타 HDD 등 (2)
-        """
-        type_upper = disk.type.upper()
-        if "NVME" in type_upper:
-            return 0  # 가장 높은 우선순위
-        if "SSD" in type_upper:
-            return 1  # 두 번째 우선순위
-        return 2  # 가장 낮은 우선순위
+                data = os.read(fd, 32)
+            finally:
+                os.close(fd)
+            return int(data)
+        except (ValueError, OSError):
+            return 0
 
     def _extract_system_info(
         self, disks: List[DiskInfo], driver_path: str, estimated_time: int
@@ -290,42 +430,39 @@ class Loader(QThread):
         info.driver_path = driver_path
         info.estimated_time_sec = estimated_time
 
-        system_volume = next(
-            (v for d in disks for v in d.volumes if v.volume_type == "System"), None
-        )
-        data_volume = next(
-            (v for d in disks for v in d.volumes if v.volume_type == "Data"), None
-        )
-        boot_volume = next(
-            (v for d in disks for v in d.volumes if v.volume_type == "Boot"), None
-        )
+        # 모든 디스크의 볼륨을 한 번만 순회하면서, 역할별로 처음 발견된 (디스크, 볼륨) 쌍과
+        # 'System' 볼륨의 개수를 함께 구합니다.
+        by_type = {}
+        system_volume_count = 0
+        for disk in disks:
+            for volume in disk.volumes:
+                if not volume.volume_type:
+                    continue
+                if volume.volume_type == "System":
+                    system_volume_count += 1
+                by_type.setdefault(volume.volume_type, (disk, volume))
 
         # '데이터 보존' 옵션을 위해 기존 볼륨 정보를 우선 기록합니다.
-        if system_volume:
-            system_disk = next((d for d in disks if system_volume in d.volumes), None)
-            if system_disk:
-                info.system_disk_index = system_disk.index
-                info.system_disk_type = system_disk.type
+        if "System" in by_type:
+            system_disk, system_volume = by_type["System"]
+            info.system_disk_index = system_disk.index
+            info.system_disk_type = system_disk.type
             info.system_volume_index = system_volume.index
 
-        if data_volume:
-            data_disk = next((d for d in disks if data_volume in d.volumes), None)
-            if data_disk:
-                info.data_disk_index = data_disk.index
+        if "Data" in by_type:
+            data_disk, data_volume = by_type["Data"]
+            info.data_disk_index = data_disk.index
             info.data_volume_index = data_volume.index
 
-        if boot_volume:
-            info.boot_volume_index = boot_volume.index
+        if "Boot" in by_type:
+            info.boot_volume_index = by_type["Boot"][1].index
+
+        info.system_volume_count = system_volume_count
 
-        info.system_volume_count = len(
-            [v for d in disks for v in d.volumes if v.volume_type == "System"]
-        )
-        
         # --- 최종 디스크 구성 결정 로직 ---
         # 1차: 우선순위 점수, 2차: 디스크 전체 크기(작은 순)로 정렬합니다.
-        sorted_disks = sorted(
-            disks, key=lambda d: (self._get_disk_priority(d), d.size_gb)
-        )
+        # (우선순위는 DiskInfo 생성 시 미리 계산되어 있습니다.)
+        sorted_disks = sorted(disks, key=lambda d: (d.priority, d.size_gb))
 
         # '클린 설치'를 위해 정렬된 디스크 목록을 기준으로 시스템/데이터 디스크를 재결정합니다.
         if sorted_disks:
@@ -9,7 +9,7 @@ from dataclasses import dataclass, field
 from typing import List
 
 
-@dataclass
+@dataclass(slots=True, eq=False)
 class Options:
     """
     사용자가 UI에서 선택한 설정 옵션을 저장하는 데이터 클래스입니다.
@@ -21,7 +21,11 @@ class Options:
     bitlocker: bool  # BitLocker 설정 여부 (True: 설정, False: 미설정)
 
 
-@dataclass
+# slots=True: 인스턴스 속성을 __dict__ 대신 슬롯에 저장하여 메모리 사용을 줄이고 속성 접근을 빠르게 합니다.
+# (Loader가 디스크/볼륨 목록을 여러 번 순회하며 속성을 읽으므로 적용합니다.)
+# eq=False: 모든 필드를 비교하는 __eq__를 만들지 않고 객체 동일성(is)으로 비교합니다.
+# (볼륨/디스크는 항상 같은 객체인지로만 구분하므로 필드 단위 비교가 필요 없습니다.)
+@dataclass(slots=True, eq=False)
 class VolumeInfo:
     """
     디스크 내의 개별 볼륨(파티션)에 대한 상세 정보를 저장하는 데이터 클래스입니다.
@@ -40,7 +44,7 @@ class VolumeInfo:
     volume_type: str = ""
 
 
-@dataclass
+@dataclass(slots=True, eq=False)
 class DiskInfo:
     """
     하나의 물리 디스크(SSD, HDD 등)에 대한 정보를 저장하는 데이터 클래스입니다.
@@ -52,9 +56,26 @@ class DiskInfo:
     # 이 디스크에 속한 볼륨들의 리스트.
     # default_factory=list: DiskInfo 객체 생성 시 volumes 리스트를 빈 리스트로 초기화합니다.
     volumes: List[VolumeInfo] = field(default_factory=list)
+    # 아래 필드들은 type으로부터 생성 시 한 번만 계산되는 값입니다. (생성자 인자가 아님)
+    # is_usb: USB 디스크 여부 (분석 대상에서 제외하는 데 사용)
+    is_usb: bool = field(init=False, repr=False, compare=False)
+    # priority: 디스크 정렬을 위한 우선순위 (낮을수록 우선순위 높음)
+    # NVMe (0) > SSD (1) > 기타 HDD 등 (2)
+    priority: int = field(init=False, repr=False, compare=False)
 
+    def __post_init__(self):
+        """type 문자열을 한 번만 대문자로 바꾸어 USB 여부와 정렬 우선순위를 미리 계산합니다."""
+        type_upper = self.type.upper()
+        self.is_usb = "USB" in type_upper
+        if "NVME" in type_upper:
+            self.priority = 0  # 가장 높은 우선순위
+        elif "SSD" in type_upper:
+            self.priority = 1  # 두 번째 우선순위
+        else:
+            self.priority = 2  # 가장 낮은 우선순위
 
-@dataclass
+
+@dataclass(slots=True, eq=False)
 class SystemInfo:
     """
     시스템 분석(Loader)이 완료된 후, 핵심 정보들을 종합하여 Worker 스레드에 전달하기 위한 데이터 클래스입니다.
@@ -72,3 +93,15 @@ class SystemInfo:
     system_volume_count: int = 0  # 발견된 시스템 볼륨('System'으로 분류된)의 총 개수
     driver_path: str = ""  # 현재 시스템에 맞는 드라이버가 위치한 폴더의 전체 경로
     estimated_time_sec: int = 0  # 이전에 저장된 작업 소요 시간 (초 단위)
+
+    @property
+    def is_save_possible(self) -> bool:
+        """
+        '데이터 보존' 옵션을 사용할 수 있는 환경인지 여부를 반환합니다.
+        조건: 시스템 볼륨이 1개이고, 데이터 볼륨과 부트 볼륨이 모두 존재해야 함.
+        """
+        return (
+            self.system_volume_count == 1
+            and self.data_volume_index != -1
+            and self.boot_volume_index != -1
+        )
@@ -1,8 +1,14 @@
 # utils.py
 
+# os 모듈: 환경 변수(SystemRoot)와 경로 조합 기능을 사용합니다.
+import os
+
 # re 모듈: 정규 표현식 처리를 위한 라이브러리입니다.
 import re
 
+# shutil 모듈: 실행 파일의 전체 경로를 찾는 which 함수를 사용합니다.
+import shutil
+
 # subprocess 모듈: 새로운 프로세스를 생성하고, 그들의 입출력 파이프에 연결하며, 반환 코드를 얻을 수 있게 해줍니다.
 # 외부 명령어(diskpart, shutdown 등)를 실행하기 위해 사용됩니다.
 import subprocess
@@ -16,10 +22,32 @@ from models import DiskInfo, VolumeInfo
 # logger.py 파일에서 함수 호출을 자동으로 로깅하는 데코레이터를 가져옵니다.
 from logger import log_function_call
 
+# diskpart 출력 파싱에 사용하는 정규 표현식들을 모듈 로드 시 한 번만 컴파일해 둡니다.
+# "1 디스크가 선택한 디스크입니다." 줄 (그룹 1: 디스크 번호)
+_DISK_SELECTED_RE = re.compile(r"(\d+) 디스크가 선택한 디스크입니다.")
+# "유형 : NVMe" 줄 (그룹 1: 디스크 유형)
+_DISK_TYPE_RE = re.compile(r"유형\s+:\s+(.+)")
+# 볼륨 목록에서 "볼륨 1" 또는 "Volume 1" 등으로 시작하는 줄 (줄 전체)
+_VOLUME_LINE_RE = re.compile(r"^[ \t]*(?:볼륨|volume).*$", re.MULTILINE | re.IGNORECASE)
+# 볼륨 정보 줄을 열 단위로 나누기 위한 두 칸 이상의 공백
+_COLUMN_SEPARATOR_RE = re.compile(r"\s{2,}")
+# "볼륨 1" 에서 숫자 부분
+_NUMBER_RE = re.compile(r"\d+")
+# "931 GB" 와 같은 크기 문자열 (그룹 1: 숫자, 그룹 2: 단위)
+_SIZE_RE = re.compile(r"(\d+\.?\d*)\s*(TB|GB|MB|KB|B)")
+# 레이블과 구분하기 위한 파일 시스템 이름 목록
+_KNOWN_FILESYSTEMS = frozenset({"NTFS", "FAT32", "FAT", "REFS", "FAT3"})
+
 # ==============================================================================
 # OS Command Utilities (운영체제 명령어 유틸리티)
 # ==============================================================================
 
+# diskpart 실행 파일의 전체 경로를 모듈 로드 시 한 번만 찾아 둡니다.
+# (실행할 때마다 PATH의 여러 폴더를 검색하지 않도록 하기 위함이며, 찾지 못하면 시스템 폴더의 기본 위치를 사용합니다.)
+_DISKPART_PATH = shutil.which("diskpart") or os.path.join(
+    os.environ.get("SystemRoot", r"C:\Windows"), "System32", "diskpart.exe"
+)
+
 
 def run_command(command: List[str]) -> Generator[Tuple[str, str], None, None]:
     """
@@ -32,14 +60,17 @@ def run_command(command: List[str]) -> Generator[Tuple[str, str], None, None]:
             command,
             stdout=subprocess.PIPE,  # 표준 출력을 파이프로 연결하여 읽을 수 있도록 함
             stderr=subprocess.PIPE,  # 표준 에러를 파이프로 연결
-            text=True,  # 입출력을 텍스트 모드로 다룸
+            text=True,  # 입출력을 텍스트 모드로 다룸 (\r, \n, \r\n을 모두 줄바꿈으로 처리)
             encoding="cp949",  # 윈도우 한글 콘솔 인코딩(cp949)으로 디코딩
+            # 깨진 바이트가 있어도 명령어 실행이 중단되지 않도록 대체 문자로 바꿉니다.
+            errors="replace",
             shell=False,  # 보안 및 안정성을 위해 shell=False로 설정 (명령어를 문자열이 아닌 리스트로 받음)
             bufsize=1,  # 버퍼 크기를 1로 설정하여 라인 단위 버퍼링을 사용 (실시간 스트리밍)
             creationflags=subprocess.CREATE_NO_WINDOW,  # 실행 시 새로운 콘솔 창이 뜨지 않도록 함
         )
 
         # iter(process.stdout.readline, ""): stdout에서 한 줄씩 계속 읽어오다가, 빈 문자열(프로세스 종료)을 만나면 중단합니다.
+        # DISM, robocopy는 진행률을 '\r'로 덮어쓰므로, 텍스트 모드의 줄바꿈 처리 덕분에 진행률이 바뀔 때마다 한 줄씩 전달됩니다.
         for line in iter(process.stdout.readline, ""):
             if not line:  # 빈 줄이면 루프를 빠져나감
                 break
@@ -74,7 +105,7 @@ def run_diskpart_script(script_content: str) -> Tuple[bool, str]:
     try:
         # subprocess.run: 명령어를 실행하고 완료될 때까지 기다립니다.
         result = subprocess.run(
-            ["diskpart"],
+            [_DISKPART_PATH],  # 미리 찾아 둔 diskpart 전체 경로로 실행
             input=script_content,  # 스크립트 내용을 표준 입력으로 전달
             capture_output=True,  # stdout, stderr를 캡처하여 result 객체에 저장
             text=True,
@@ -150,20 +181,23 @@ class Parser:
         DiskInfo 객체 리스트를 생성하여 반환합니다.
         """
         disks = []
-        # "디스크 1이(가) 선택한 디스크입니다." 와 같은 줄을 기준으로 전체 텍스트를 각 디스크별 정보로 분할합니다.
-        disk_chunks = re.split(r"(\d+ 디스크가 선택한 디스크입니다.)", output)
-
-        # 분할된 리스트는 [전 내용, 구분자1, 디스크1내용, 구분자2, 디스크2내용, ...] 형태가 됩니다.
-        for i in range(1, len(disk_chunks), 2):
-            separator_chunk = disk_chunks[i]  # 예: "1 디스크가 선택한 디스크입니다."
-            content_chunk = disk_chunks[i + 1]  # 예: 디스크 1의 상세 정보 텍스트
+        # "1 디스크가 선택한 디스크입니다." 와 같은 줄을 모두 찾아, 각 줄부터 다음 줄 전까지를 한 디스크의 정보로 봅니다.
+        separators = list(_DISK_SELECTED_RE.finditer(output))
+
+        for i, separator in enumerate(separators):
+            # 현재 구분자 뒤부터 다음 구분자 앞(마지막이면 끝)까지가 이 디스크의 상세 정보 범위입니다.
+            # 범위만큼 문자열을 잘라 복사하지 않고, 전체 출력에서 (시작, 끝) 위치를 지정하여 검색합니다.
+            content_start = separator.end()
+            content_end = (
+                separators[i + 1].start() if i + 1 < len(separators) else len(output)
+            )
 
             # 구분자에서 디스크 인덱스 번호를 추출합니다.
-            disk_index_str = re.match(r"(\d+)", separator_chunk).group(1)
+            disk_index_str = separator.group(1)
             disk_index = int(disk_index_str)
 
             # 디스크 유형(SATA, NVMe 등)을 추출합니다.
-            type_match = re.search(r"유형\s+:\s+(.+)", content_chunk)
+            type_match = _DISK_TYPE_RE.search(output, content_start, content_end)
             disk_type_str = type_match.group(1).strip() if type_match else "알 수 없음"
 
             # 미리 파싱해둔 크기 정보를 가져옵니다.
@@ -176,28 +210,22 @@ class Parser:
             )
 
             # 볼륨 정보 섹션 파싱 시작
-            in_volume_section = False
-            for line in content_chunk.splitlines():
-                if "볼륨 ###" in line:
-                    in_volume_section = True
-                    continue
-
-                if not in_volume_section or "--------" in line or not line.strip():
-                    continue
-
+            # "볼륨 ###" 헤더가 없으면 이 디스크에는 볼륨이 없으므로 검색 범위를 비워 둡니다.
+            volume_section_start = output.find("볼륨 ###", content_start, content_end)
+            if volume_section_start == -1:
+                volume_section_start = content_end
+
+            # 헤더 이후에서 "볼륨 1", "Volume 1" 등으로 시작하는 줄만 정규 표현식으로 한 번에 찾습니다.
+            # (구분선, 빈 줄 등 나머지 줄은 파이썬 코드에서 한 줄씩 검사하지 않고 건너뜁니다.)
+            for line_match in _VOLUME_LINE_RE.finditer(
+                output, volume_section_start, content_end
+            ):
                 try:
                     # 두 칸 이상의 공백을 기준으로 줄을 분리하여 볼륨 정보를 추출합니다.
-                    parts = re.split(r"\s{2,}", line.strip())
-
-                    # "볼륨 1", "Volume 1" 등으로 시작하지 않는 줄은 건너뜁니다.
-                    if not parts or not (
-                        parts[0].lower().startswith("volume")
-                        or parts[0].startswith("볼륨")
-                    ):
-                        continue
+                    parts = _COLUMN_SEPARATOR_RE.split(line_match.group().strip())
 
                     # "볼륨 1" 에서 숫자 "1"을 추출합니다.
-                    vol_index_match = re.search(r"\d+", parts[0])
+                    vol_index_match = _NUMBER_RE.search(parts[0])
                     if not vol_index_match:
                         continue
                     vol_index = int(vol_index_match.group())
@@ -215,9 +243,8 @@ class Parser:
                         p += 1
 
                     # 레이블(Label) 파싱 (파일 시스템 이름이 아니어야 함)
-                    known_fs = {"NTFS", "FAT32", "FAT", "REFS", "FAT3"}
                     label = ""
-                    if p < len(parts) and parts[p].upper() not in known_fs:
+                    if p < len(parts) and parts[p].upper() not in _KNOWN_FILESYSTEMS:
                         label = parts[p]
                         p += 1
 
@@ -258,7 +285,7 @@ class Parser:
         """
         size_str = size_str.strip().upper()
         # 정규 표현식으로 숫자 부분과 단위 부분을 분리합니다.
-        match = re.match(r"(\d+\.?\d*)\s*(TB|GB|MB|KB|B)", size_str)
+        match = _SIZE_RE.match(size_str)
         if not match:
             return 0.0
 
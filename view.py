@@ -1,8 +1,12 @@
 # view.py
 
-# PyQt6.QtCore 모듈에서 pyqtSignal 클래스를 가져옵니다.
+# collections 모듈: 로그 메시지를 모아두는 deque(양방향 큐)를 제공합니다.
+from collections import deque
+
+# PyQt6.QtCore 모듈에서 pyqtSignal, QTimer 클래스를 가져옵니다.
 # pyqtSignal: 사용자 정의 시그널을 생성하여 객체 간의 통신을 가능하게 합니다.
-from PyQt6.QtCore import pyqtSignal
+# QTimer: 모아둔 로그 메시지를 일정 시간 후 한 번에 출력하기 위한 타이머입니다.
+from PyQt6.QtCore import pyqtSignal, QTimer
 
 # PyQt6.QtWidgets 모듈에서 GUI 구성에 필요한 다양한 위젯 클래스들을 가져옵니다.
 from PyQt6.QtWidgets import (
@@ -81,8 +85,36 @@ class View(QMainWindow):
         )
         # QtLogHandler 인스턴스를 생성하여 로깅 시스템과 UI를 연결합니다.
         self.log_handler = QtLogHandler()
-        # 로그 핸들러에서 log_received 시그널이 발생하면, 그 메시지를 상단 로그 뷰어에 추가(append)하도록 연결합니다.
-        self.log_handler.log_received.connect(self.log_viewer_top.append)
+        # 로그 메시지를 바로 추가하지 않고 모아두었다가 약 33ms(≈30Hz)마다 한 번에 추가하여 위젯 갱신 횟수를 줄입니다.
+        self._pending_logs = deque()
+        self._log_flush_timer = QTimer(self)
+        self._log_flush_timer.setSingleShot(True)
+        self._log_flush_timer.setInterval(33)
+        self._log_flush_timer.timeout.connect(self._flush_logs)
+        # 로그 핸들러에서 log_received 시그널이 발생하면, 그 메시지를 대기열에 추가하도록 연결합니다.
+        self.log_handler.log_received.connect(self._enqueue_log)
+
+    def _enqueue_log(self, message: str):
+        """로그 메시지를 대기열에 추가하고, 출력 타이머가 멈춰 있으면 시작합니다."""
+        self._pending_logs.append(message)
+        if not self._log_flush_timer.isActive():
+            self._log_flush_timer.start()
+
+    def _flush_logs(self):
+        """대기열에 모인 로그 메시지들을 한 번에 상단 로그 뷰어에 추가합니다."""
+        if not self._pending_logs:
+            return
+        batch = "\n".join(self._pending_logs)
+        self._pending_logs.clear()
+        self.log_viewer_top.append(batch)
+
+    def clear_log(self):
+        """대기열에 남은 로그와 출력 타이머까지 함께 비워, 이전 작업의 로그가 새 작업의 로그에 섞이지 않도록 상단 로그 뷰어를 초기화합니다."""
+        self._pending_logs.clear()
+        self._log_flush_timer.stop()
+        # 이미 비어 있으면 다시 그리지 않도록 건너뜁니다.
+        if not self.log_viewer_top.document().isEmpty():
+            self.log_viewer_top.clear()
 
     def _set_window_size_and_position(self, width: int, height: int):
         """창의 크기를 설정하고 화면의 중앙에 위치시키는 메서드입니다."""
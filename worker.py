@@ -61,6 +61,8 @@ class Worker(QThread):
         self._is_running = True
         # 현재까지의 누적 진행률을 저장하는 변수입니다.
         self.current_progress = 0
+        # 마지막으로 UI에 보낸 진행률 값입니다. 같은 값을 반복해서 보내지 않기 위해 사용합니다.
+        self._last_emitted_progress = -1
 
     def run(self):
         """
@@ -123,7 +125,7 @@ class Worker(QThread):
             self._update_progress(1)  # 진행률 1% 증가
 
             # 모든 작업이 끝나면 진행률을 100%로 설정하고 완료 신호를 보냅니다.
-            self.progress_updated.emit(100)
+            self._emit_progress(100)
             self.finished.emit()
 
         except UserCancelledError:
@@ -137,7 +139,17 @@ class Worker(QThread):
     def _update_progress(self, value: int):
         """현재 진행률에 주어진 값을 더하고 UI를 업데이트합니다."""
         self.current_progress += value
-        self.progress_updated.emit(self.current_progress)
+        self._emit_progress(self.current_progress)
+
+    def _emit_progress(self, value: int):
+        """
+        진행률 시그널을 보냅니다.
+        DISM 출력처럼 같은 진행률이 여러 줄에 걸쳐 반복되는 경우, 값이 바뀔 때만 시그널을 보내
+        스레드 간 이벤트 수를 줄입니다.
+        """
+        if value != self._last_emitted_progress:
+            self._last_emitted_progress = value
+            self.progress_updated.emit(value)
 
     def _execute_command(self, command: List[str], operation_name: str):
         """
@@ -343,12 +355,15 @@ class Worker(QThread):
                 # DISM의 진행률(0-100)을 이 작업의 가중치(task_weight)에 맞게 변환합니다.
                 dism_progress = float(progress_match.group(1))
                 gui_progress = start_progress + int(dism_progress / 100 * task_weight)
-                self.progress_updated.emit(
-                    gui_progress
-                )  # 변환된 진행률을 UI에 업데이트
+                self._emit_progress(gui_progress)  # 변환된 진행률을 UI에 업데이트
 
             if type == "stdout":
-                logging.info(line)
+                # 진행률 표시 줄은 프로그레스 바로 이미 반영되므로 DEBUG 레벨로 기록하여
+                # 기본 로그 레벨(INFO)에서는 처리 없이 바로 걸러지도록 합니다.
+                if progress_match:
+                    logging.debug(line)
+                else:
+                    logging.info(line)
             elif type == "stderr":
                 logging.warning(f"오류 스트림: {line}")
             elif type == "return_code":
@@ -392,10 +407,10 @@ class Worker(QThread):
                     task_progress = current_count / total_count
                     # 전체 진행률을 계산하여 UI에 업데이트합니다.
                     gui_progress = start_progress + int(task_progress * task_weight)
-                    self.progress_updated.emit(gui_progress)
+                    self._emit_progress(gui_progress)
 
         # 루프가 끝나면(모든 드라이버 설치 완료), 이 작업에 할당된 가중치만큼 진행률을 더해 정확히 맞춥니다.
-        self.progress_updated.emit(start_progress + task_weight)
+        self._emit_progress(start_progress + task_weight)
 
     def _restore(self):
         """